@@ -0,0 +1,57 @@
+"""
+Import cost of the core engine, measured in fresh interpreters.
+
+    python -m benchmarks.import_time [--budget-ms 150]
+
+Exits non-zero when the median import exceeds the budget or when an
+optional reporting dependency is pulled in at import time.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+FORBIDDEN = ("matplotlib", "enlighten", "adjustText", "shapely")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import genetic_algorithm
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "ms": 1000 * elapsed,
+    "modules": sorted({name.split(".")[0] for name in sys.modules}),
+    "handlers": len(__import__("logging").getLogger().handlers),
+}))
+"""
+
+
+def measure(repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", PROBE], check=True, capture_output=True, text=True).stdout
+        samples.append(json.loads(output))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    args = parser.parse_args()
+
+    samples = measure(args.repeat)
+    median = statistics.median(sample["ms"] for sample in samples)
+    loaded = [name for name in FORBIDDEN if name in samples[0]["modules"]]
+
+    print(f"import genetic_algorithm: median {median:.1f} ms over {args.repeat} runs")
+    print(f"optional dependencies loaded: {loaded or 'none'}")
+    print(f"root logging handlers installed: {samples[0]['handlers']}")
+
+    if loaded or samples[0]["handlers"] or median > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
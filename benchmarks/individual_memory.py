@@ -0,0 +1,56 @@
+"""
+Resident memory per individual for the legacy (uuid4 string, list, fitness)
+tuple and for Individual, measured with tracemalloc.
+
+    python -m benchmarks.individual_memory [--size 100000]
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+import uuid
+from array import array
+
+from genetic_algorithm.individual import Individual
+from examples.wifi_coverage.run import WiFiCoverageGeneticAlgorithm
+
+
+def random_chromosome(gene_space: list) -> list:
+    return [
+        random.randint(min, max) if gene_type == int else random.uniform(min, max)
+        for gene_type, min, max in gene_space
+    ]
+
+
+def measure(build, size: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    population = [build() for _ in range(size)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del population
+    return current / size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    ga = WiFiCoverageGeneticAlgorithm()
+    gene_space = ga.gene_space
+
+    legacy = measure(lambda: (str(uuid.uuid4()), random_chromosome(gene_space), random.random()), args.size)
+    compact = measure(
+        lambda: Individual(array(ga.gene_typecode, random_chromosome(gene_space)), random.random()),
+        args.size,
+    )
+
+    print(f"{len(gene_space)} genes, {args.size} individuals")
+    print(f"tuple(uuid4, list, float): {legacy:7.1f} bytes/individual")
+    print(f"Individual(array('{ga.gene_typecode}')): {compact:7.1f} bytes/individual ({compact / legacy:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+Throughput and peak memory of the engine and the bundled examples, run
+headless with seeded RNGs so two runs on the same machine are comparable.
+
+    python -m benchmarks.suite [--quick] [--filter wifi] [--baseline benchmarks/baseline.json]
+    python -m benchmarks.suite --quick --save benchmarks/baseline.json
+
+The stored baseline is a --quick run; throughput is machine specific, so
+record a fresh one before judging a change on different hardware.
+
+Each case is timed once, then run again under tracemalloc for its peak
+memory. With a baseline, a case fails when its throughput drops or its
+peak memory grows by more than --tolerance, and the exit status is non-zero.
+"""
+import argparse
+import fnmatch
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from examples.coverage.coverage_index import CoverageIndex
+from examples.coverage.plan import Plan as CoveragePlan
+from examples.coverage import run as coverage
+from examples.six_hump_camel_function import SixHumpCamelGeneticAlgorithm, SixHumpCamelVectorizedGeneticAlgorithm
+from examples.wifi_coverage import run as wifi
+from examples.wifi_coverage.floor_plan import FloorPlan
+from examples.wifi_coverage.plan import WALL_TYPE
+from genetic_algorithm import ReplacementMethod
+
+SEED = 0
+
+
+def scaled(algorithm_class, **attributes):
+    return type(algorithm_class.__name__, (algorithm_class,), attributes)
+
+
+def synthetic_targets(count: int, dimensions: tuple, seed: int = SEED) -> list:
+    rng = np.random.default_rng(seed)
+    w, h = dimensions
+    return [(int(x), int(y)) for x, y in rng.integers(0, (w + 1, h + 1), size=(count, 2))]
+
+
+def synthetic_walls(count: int, dimensions: tuple, seed: int = SEED) -> list:
+    # axis-aligned segments up to a quarter of the floor long, of random material
+    rng = np.random.default_rng(seed)
+    w, h = dimensions
+    materials = [WALL_TYPE.CONCRETE, WALL_TYPE.DRY_WALL, WALL_TYPE.LIME_BRICK, WALL_TYPE.CHIP_BOARD]
+    walls = []
+    for _ in range(count):
+        x, y = rng.uniform(0, w), rng.uniform(0, h)
+        if rng.random() < 0.5:
+            end = (min(x + rng.uniform(1, w / 4), w), y)
+        else:
+            end = (x, min(y + rng.uniform(1, h / 4), h))
+        walls.append([(x, y), end, materials[rng.integers(len(materials))]])
+    return walls
+
+
+class SyntheticCoverageGeneticAlgorithm(coverage.CoverageGeneticAlgorithm):
+    targets = []
+    coverage_index = None
+
+    def fitness_func(self, chromosome: list) -> float:
+        plan = CoveragePlan(chromosome, self.targets, coverage.DIMENSIONS, coverage.MAX_SENSORS, self.coverage_index)
+        return plan.evaluate()
+
+
+def coverage_algorithm(targets: int):
+    targets = synthetic_targets(targets, coverage.DIMENSIONS)
+    return scaled(SyntheticCoverageGeneticAlgorithm, targets=targets, coverage_index=CoverageIndex(targets))
+
+
+def wifi_algorithm(walls: int, users: int, transceivers: int = None):
+    attributes = {}
+    if transceivers:
+        # exactly this many in use
+        gene_space = wifi._gene_space(transceivers)
+        gene_space[0] = (int, transceivers, transceivers)
+        attributes = {"max_transceivers": transceivers, "gene_space": gene_space}
+    return scaled(
+        wifi.WiFiCoverageGeneticAlgorithm,
+        targets=synthetic_targets(users, wifi.DIMENSIONS),
+        floor_plan=FloorPlan(synthetic_walls(walls, wifi.DIMENSIONS)),
+        **attributes,
+    )
+
+
+def run_algorithm(algorithm_class) -> dict:
+    ga = algorithm_class()
+    ga.reseed(SEED)
+    start = time.perf_counter()
+    ga.run()
+    seconds = time.perf_counter() - start
+    return {
+        "seconds": seconds,
+        "throughput": ga.generations / seconds,
+        "unit": "generations/s",
+        "evaluations_per_second": ga.evaluations / seconds,
+    }
+
+
+def run_operator(algorithm_class, operator: str, repeat: int) -> dict:
+    ga = algorithm_class()
+    ga.reseed(SEED)
+    ga._initialise_population()
+    vectorized = hasattr(ga, "genes")
+
+    seconds = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parents = ga.perform_selection()
+        if operator == "selection":
+            seconds += time.perf_counter() - start
+            continue
+
+        start = time.perf_counter()
+        children = ga.perform_crossover(parents)
+        if operator == "crossover":
+            seconds += time.perf_counter() - start
+            continue
+
+        start = time.perf_counter()
+        children = ga.perform_mutation(children)
+        if operator == "mutation":
+            seconds += time.perf_counter() - start
+            continue
+
+        if vectorized:
+            fitness = ga._score(children)
+            start = time.perf_counter()
+            ga.perform_replacement(parents, children, fitness)
+        else:
+            ga._calculate_fitness(children)
+            start = time.perf_counter()
+            ga.perform_replacement(parents, children)
+        seconds += time.perf_counter() - start
+
+    return {"seconds": seconds, "throughput": repeat / seconds, "unit": "calls/s", "evaluations_per_second": None}
+
+
+def cases(quick: bool) -> dict:
+    scale = 10 if quick else 1
+    generations = 10
+    cases = {}
+
+    for size in (100, 1000, 10000):
+        size //= scale
+        cases[f"six_hump/list/{size}"] = lambda size=size: run_algorithm(
+            scaled(SixHumpCamelGeneticAlgorithm, generations=generations, population_size=size,
+                   num_of_parents=size // 5)
+        )
+    for size in (10000, 100000, 1000000):
+        size //= scale
+        cases[f"six_hump/vectorized/{size}"] = lambda size=size: run_algorithm(
+            scaled(SixHumpCamelVectorizedGeneticAlgorithm, generations=generations, population_size=size,
+                   num_of_parents=size // 5)
+        )
+
+    for targets in (10, 100, 1000):
+        cases[f"coverage/targets={targets}"] = lambda targets=targets: run_algorithm(
+            scaled(coverage_algorithm(targets), generations=generations, population_size=1000 // scale,
+                   num_of_parents=100 // scale)
+        )
+
+    for walls, users in ((10, 10), (100, 50), (1000, 200)):
+        cases[f"wifi/walls={walls},users={users}"] = lambda walls=walls, users=users: run_algorithm(
+            scaled(wifi_algorithm(walls, users), generations=generations, population_size=100,
+                   num_of_parents=40)
+        )
+    # children differing from their parents in a gene or two, scored from the
+    # parents' path loss rows (incremental) or from scratch
+    users = 300 // scale
+    for partials_cache_size, mode in ((None, "incremental"), (0, "from_scratch")):
+        cases[f"wifi/transceivers=12,walls=100,users={users}/{mode}"] = lambda size=partials_cache_size: run_algorithm(
+            scaled(wifi_algorithm(100, users, transceivers=12), generations=generations, population_size=100,
+                   num_of_parents=40, mutation_rate=0.05, partials_cache_size=size)
+        )
+
+    repeat = 50
+    for engine, algorithm_class, size in (
+            ("list", SixHumpCamelGeneticAlgorithm, 5000 // scale),
+            ("vectorized", SixHumpCamelVectorizedGeneticAlgorithm, 100000 // scale),
+    ):
+        for operator in ("selection", "crossover", "mutation"):
+            cases[f"operator/{engine}/{operator}"] = lambda a=algorithm_class, size=size, operator=operator: (
+                run_operator(scaled(a, population_size=size, num_of_parents=size // 5), operator, repeat)
+            )
+        for method in ReplacementMethod:
+            cases[f"operator/{engine}/replacement/{method.name}"] = lambda a=algorithm_class, size=size, method=method: (
+                run_operator(
+                    scaled(a, population_size=size, num_of_parents=size // 5, replacement_method=method),
+                    "replacement",
+                    repeat,
+                )
+            )
+
+    return cases
+
+
+def peak_memory(case) -> int:
+    tracemalloc.start()
+    try:
+        case()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if result["throughput"] < previous["throughput"] * (1 - tolerance):
+            regressions.append(f"{name}: {result['throughput']:.4g} {result['unit']}, was {previous['throughput']:.4g}")
+        if result["peak_bytes"] > previous["peak_bytes"] * (1 + tolerance):
+            regressions.append(f"{name}: peak {result['peak_bytes']} bytes, was {previous['peak_bytes']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="one tenth of the population sizes")
+    parser.add_argument("--filter", default="*", help="glob over case names")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save", help="write the results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for name, case in cases(args.quick).items():
+        if not fnmatch.fnmatch(name, f"*{args.filter}*"):
+            continue
+        random.seed(SEED)
+        result = case()
+        random.seed(SEED)
+        result["peak_bytes"] = peak_memory(case)
+        results[name] = result
+
+        evaluations = result["evaluations_per_second"]
+        print(
+            f"{name:<50}{result['throughput']:>12.4g} {result['unit']:<14}"
+            f"{'' if evaluations is None else f'{evaluations:>12.4g} evaluations/s':<28}"
+            f"{result['peak_bytes'] / 2 ** 20:>10.2f} MiB peak"
+        )
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"python": platform.python_version(), "quick": args.quick, "results": results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["quick"] != args.quick:
+            sys.exit(f"{args.baseline} was recorded with quick={baseline['quick']}")
+        regressions = compare(results, baseline["results"], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import itertools
+
+import numpy as np
+
+
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+class CoverageIndex:
+    """
+    Targets covered by a sensor at an integer (range, x, y), stored as an
+    int bitset (bit i is targets[i]) with the summed distance to those
+    targets. Entries are filled on first use or all at once by precompute().
+    """
+
+    def __init__(self, targets: list):
+        self.targets = targets
+        self._coordinates = np.asarray(targets, dtype=float).reshape(-1, 2)
+        self._nbytes = (len(self._coordinates) + 7) // 8
+        self._table = {}
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def lookup(self, sensor_range: int, x: int, y: int) -> tuple:
+        key = sensor_range, x, y
+        entry = self._table.get(key)
+        if entry is None:
+            distances = np.hypot(self._coordinates[:, 0] - x, self._coordinates[:, 1] - y)
+            covered = distances <= sensor_range
+            mask = int.from_bytes(np.packbits(covered, bitorder="little").tobytes(), "little")
+            entry = self._table[key] = mask, float(distances[covered].sum())
+        return entry
+
+    def distance_sum(self, mask: int, x: int, y: int) -> float:
+        selected = np.unpackbits(
+            np.frombuffer(mask.to_bytes(self._nbytes, "little"), dtype=np.uint8),
+            count=len(self._coordinates),
+            bitorder="little",
+        ).astype(bool)
+        coordinates = self._coordinates[selected]
+        return float(np.hypot(coordinates[:, 0] - x, coordinates[:, 1] - y).sum())
+
+    def precompute(self, max_range: int, dimensions: tuple) -> None:
+        w, h = dimensions
+        for sensor_range, x, y in itertools.product(range(1, max_range + 1), range(w + 1), range(h + 1)):
+            self.lookup(sensor_range, x, y)
@@ -1,7 +1,4 @@
-import math
-
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
+from examples.coverage.coverage_index import CoverageIndex, popcount
 
 
 def split(list_a, chunk_size):
@@ -10,7 +7,14 @@ def split(list_a, chunk_size):
 
 
 class Plan:
-    def __init__(self, chromosome: list, targets: list, dimensions: tuple, max_sensors: int):
+    def __init__(
+            self,
+            chromosome: list,
+            targets: list,
+            dimensions: tuple,
+            max_sensors: int,
+            coverage_index: CoverageIndex = None,
+    ):
         self.max_sensors = max_sensors
 
         self.no_of_sensors = chromosome[0]
@@ -20,32 +24,38 @@ class Plan:
         self.sensors = sensors[:self.no_of_sensors]
 
         self.targets = targets
+        self.coverage_index = CoverageIndex(targets) if coverage_index is None else coverage_index
 
         self.w, self.h = dimensions
 
     def evaluate(self):
-        connected = set()
-
-        signal_qualities = []
+        coverage, signal_qualities, efficiency = self.objectives()
+        return 3 * coverage + 0.5 * signal_qualities + efficiency
 
-        for target in self.targets:
-            for sensor in self.sensors:
-                sensor_range = sensor[0]
-                sensor = sensor[1:]
+    def objectives(self) -> tuple:
+        # coverage, signal quality, efficiency; all maximised
+        connected = 0
 
-                signal_quality = math.dist(sensor, target)
+        signal_qualities = 0.0
 
-                if signal_quality <= sensor_range and target not in connected:
-                    connected.add(target)
-                    signal_qualities.append(signal_quality)
+        # a target connects to the first sensor that covers it
+        for sensor_range, x, y in self.sensors:
+            covered, distances = self.coverage_index.lookup(sensor_range, x, y)
+            if covered & connected:
+                distances = self.coverage_index.distance_sum(covered & ~connected, x, y)
+            connected |= covered
+            signal_qualities += distances
 
-        coverage = len(connected) / len(self.targets)
-        signal_qualities = sum(signal_qualities) and 1 / sum(signal_qualities) or 0
+        coverage = popcount(connected) / len(self.targets)
+        signal_qualities = signal_qualities and 1 / signal_qualities or 0
         efficiency = self.max_sensors / self.no_of_sensors
 
-        return 3 * coverage + 0.5 * signal_qualities + efficiency
+        return coverage, signal_qualities, efficiency
 
     def plot(self, name: str = None):
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import Circle
+
         fig, ax = plt.subplots()
         ax.set_xlim([0, self.w])
         ax.set_ylim([0, self.h])
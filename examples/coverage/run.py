@@ -1,5 +1,10 @@
+from examples.coverage.coverage_index import CoverageIndex
 from examples.coverage.plan import Plan
 from genetic_algorithm import GeneticAlgorithm, SelectionMethods, ReplacementMethod
+from genetic_algorithm.multiobjective import MultiObjectiveGeneticAlgorithm
+from genetic_algorithm.reporting import ProgressBar, configure_logging
+from genetic_algorithm.stopping import Stagnation
+from genetic_algorithm.telemetry import JSONLinesSink, plot_telemetry
 
 # Problem Parameters
 TARGETS = [(25, 25), (75, 75)]
@@ -7,6 +12,8 @@ MAX_SENSORS = 2
 SENSOR_RANGE = 30
 DIMENSIONS = 100, 100
 
+COVERAGE_INDEX = CoverageIndex(TARGETS)
+
 
 def split(list_a, chunk_size):
     for i in range(0, len(list_a), chunk_size):
@@ -38,19 +45,35 @@ class CoverageGeneticAlgorithm(GeneticAlgorithm):
     population_size = 1000
     selection_method = SelectionMethods.tournament_selection
     replacement_method = ReplacementMethod.NO_REPLACEMENT
+    stopping_criteria = [Stagnation(100)]
     gene_space = _gene_space()
 
     def fitness_func(self, chromosome: list) -> float:
-        plan = Plan(chromosome, TARGETS, DIMENSIONS, MAX_SENSORS)
+        plan = Plan(chromosome, TARGETS, DIMENSIONS, MAX_SENSORS, COVERAGE_INDEX)
         return plan.evaluate()
 
 
+class CoverageMultiObjectiveGeneticAlgorithm(MultiObjectiveGeneticAlgorithm, CoverageGeneticAlgorithm):
+    """
+    Coverage, signal quality and efficiency kept apart; the weights are the
+    ones CoverageGeneticAlgorithm folds them into a single fitness with
+    """
+    objective_weights = (3, 0.5, 1)
+
+    def fitness_func(self, chromosome: list) -> tuple:
+        plan = Plan(chromosome, TARGETS, DIMENSIONS, MAX_SENSORS, COVERAGE_INDEX)
+        return plan.objectives()
+
+
 if __name__ == '__main__':
+    configure_logging()
     ga = CoverageGeneticAlgorithm()
+    ga.reporters = [ProgressBar(), JSONLinesSink('telemetry.jsonl')]
     ga.run()
+    plot_telemetry('telemetry.jsonl')
 
     best_individual = ga.population[0]
 
-    _, chromosome, _ = best_individual
+    chromosome = ga.decode(best_individual.genes)
     plan = Plan(chromosome, TARGETS, DIMENSIONS, MAX_SENSORS)
     plan.plot()
@@ -1,4 +1,9 @@
+import numpy as np
+
 from genetic_algorithm import GeneticAlgorithm, SelectionMethods, ReplacementMethod
+from genetic_algorithm.reporting import ProgressBar, configure_logging
+from genetic_algorithm.telemetry import JSONLinesSink, plot_telemetry
+from genetic_algorithm.vectorized import VectorizedGeneticAlgorithm, VectorizedSelectionMethods
 
 
 class SixHumpCamelGeneticAlgorithm(GeneticAlgorithm):
@@ -24,6 +29,24 @@ class SixHumpCamelGeneticAlgorithm(GeneticAlgorithm):
         )
 
 
+class SixHumpCamelVectorizedGeneticAlgorithm(VectorizedGeneticAlgorithm, SixHumpCamelGeneticAlgorithm):
+    num_of_parents = 20000
+    population_size = 100000
+    selection_method = VectorizedSelectionMethods.tournament_selection
+    replacement_method = ReplacementMethod.WEAK_INDIVIDUALS
+
+    def batch_fitness_func(self, matrix: np.ndarray) -> np.ndarray:
+        x, y = matrix[:, 0], matrix[:, 1]
+        return - (
+                (4 - 2.1 * x ** 2 + x ** 4 / 3.0) * x ** 2
+                + x * y
+                + (-4 + 4 * y ** 2) * y ** 2
+        )
+
+
 if __name__ == '__main__':
+    configure_logging()
     ga = SixHumpCamelGeneticAlgorithm()
+    ga.reporters = [ProgressBar(), JSONLinesSink('telemetry.jsonl')]
     ga.run()
+    plot_telemetry('telemetry.jsonl')
@@ -0,0 +1,39 @@
+import numpy as np
+import shapely
+from shapely import STRtree
+
+
+class FloorPlan:
+    """
+    Walls of a scenario prepared once: a shapely STRtree over the wall
+    segments and their attenuation as an array, so the wall loss of every
+    router-user path is found with one bulk query.
+    """
+
+    def __init__(self, walls: list = None):
+        self.walls = walls or []
+        self.attenuation = np.array([wall_type for _, _, wall_type in self.walls], dtype=float)
+        self.index = STRtree([shapely.LineString([point_1, point_2]) for point_1, point_2, _ in self.walls])
+
+    def wall_attenuation(self, routers, users) -> np.ndarray:
+        """
+        Total attenuation of the walls crossed by the straight path between
+        each router (x, y) and user (x, y), as a routers x users array.
+        """
+        routers = np.asarray(routers, dtype=float).reshape(-1, 2)
+        users = np.asarray(users, dtype=float).reshape(-1, 2)
+        shape = len(routers), len(users)
+        if not len(self.walls) or not routers.size or not users.size:
+            return np.zeros(shape)
+
+        paths = np.empty(shape + (2, 2))
+        paths[:, :, 0] = routers[:, None, :]
+        paths[:, :, 1] = users[None, :, :]
+        path_idx, wall_idx = self.index.query(shapely.linestrings(paths.reshape(-1, 2, 2)), predicate="intersects")
+        # a router on top of its user has no path, so it crosses no wall
+        on_top = (routers[:, None, :] == users[None, :, :]).all(axis=-1).ravel()
+        if on_top.any():
+            crossed = ~on_top[path_idx]
+            path_idx, wall_idx = path_idx[crossed], wall_idx[crossed]
+        losses = np.bincount(path_idx, weights=self.attenuation[wall_idx], minlength=shape[0] * shape[1])
+        return losses.reshape(shape)
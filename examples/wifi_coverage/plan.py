@@ -1,12 +1,8 @@
-import statistics
-
-import math
-import matplotlib.pyplot as plt
-from adjustText import adjust_text
+import numpy as np
 
+from examples.wifi_coverage.floor_plan import FloorPlan
 from examples.wifi_coverage.utils import (
     ITUP1238IndoorPropagationModel,
-    segment_intersect,
     split,
 )
 
@@ -29,7 +25,7 @@ class Plan:
             transceiver_antenna_gain: float,
             user_device_antenna_gain: float,
             desired_received_power: float,
-            walls=None,
+            floor_plan: FloorPlan = None,
     ):
         self.max_transceivers = max_transceivers
 
@@ -46,43 +42,77 @@ class Plan:
 
         self.w, self.h = dimensions
 
-        self.walls = walls or []
+        self.floor_plan = floor_plan or FloorPlan()
 
         self.desired_rssi = desired_received_power
 
         self.propagation_model = ITUP1238IndoorPropagationModel(operating_frequency)
 
-    def connect_users(self):
-        connections = {}
-
-        for user in self.users_devices:
-            for router in self.transceivers:
-                rssi = self.determine_received_power(router, user)
+    def path_loss_matrix(self, routers, users: list = None) -> np.ndarray:
+        """
+        Propagation and wall loss between every router (x, y) and every
+        user device as a routers x users array; it does not depend on the
+        transmit power.
+        """
+        routers = np.asarray(routers, dtype=float).reshape(-1, 2)
+        users = np.asarray(self.users_devices if users is None else users, dtype=float).reshape(-1, 2)
+
+        distances = np.hypot(
+            routers[:, None, 0] - users[None, :, 0],
+            routers[:, None, 1] - users[None, :, 1],
+        )
+        path_loss = self.propagation_model.run_many(distances)
+        path_loss += self.floor_plan.wall_attenuation(routers, users)
+        return path_loss
+
+    def received_power_matrix(self, transceivers: list = None, users: list = None,
+                              path_loss: np.ndarray = None) -> np.ndarray:
+        """
+        RSSI of every transceiver at every user device as a
+        transceivers x users array, from their path_loss_matrix when given.
+        """
+        transceivers = np.asarray(
+            self.transceivers if transceivers is None else transceivers, dtype=float
+        ).reshape(-1, 3)
+
+        transmit_power = transceivers[:, 0]
+        if path_loss is None:
+            path_loss = self.path_loss_matrix(transceivers[:, 1:], users)
+        return (
+                transmit_power[:, None]
+                + self.transceiver_antenna_gain
+                - path_loss
+                + self.user_device_antenna_gain
+        )
 
-                if self.desired_rssi > rssi:
-                    continue
+    def assign_connections(self, rssi: np.ndarray) -> tuple:
+        # each user connects to its strongest transceiver if that one is good enough
+        best_router = np.argmax(rssi, axis=0)
+        best_rssi = rssi[best_router, np.arange(rssi.shape[1])]
+        return best_router, best_rssi, best_rssi >= self.desired_rssi
 
-                user_id = str(user)
-                if user_id not in connections:
-                    connections.update({user_id: [router, rssi]})
-                else:
-                    [_, preexisting_connection_rssi] = connections[user_id]
-                    if rssi < preexisting_connection_rssi:
-                        connections.update({user_id: [router, rssi]})
+    def connect_users(self):
+        best_router, best_rssi, connected = self.assign_connections(self.received_power_matrix())
 
+        connections = {}
+        for j in np.flatnonzero(connected):
+            connections[str(self.users_devices[j])] = [self.transceivers[best_router[j]], float(best_rssi[j])]
         return connections
 
-    def evaluate(self):
-        connections_registry = self.connect_users()
+    def evaluate(self, path_loss: np.ndarray = None):
+        coverage, signal_quality, efficiency = self.objectives(path_loss)
+        return float(3 * coverage + efficiency + 0.5 * signal_quality)
 
-        coverage = len(connections_registry) / len(self.users_devices)
+    def objectives(self, path_loss: np.ndarray = None) -> tuple:
+        # coverage, signal quality (the negated effective RSSI), efficiency; all maximised
+        _, best_rssi, connected = self.assign_connections(self.received_power_matrix(path_loss=path_loss))
 
-        signal_qualities = []
-        for [_, rssi] in connections_registry.values():
-            signal_qualities.append(rssi)
-        total_received_power = sum(signal_qualities) and 1 / sum(signal_qualities) or 0
+        coverage = connected.sum() / len(self.users_devices)
+
+        signal_qualities = best_rssi[connected]
+        total_received_power = signal_qualities.sum() and 1 / signal_qualities.sum() or 0
         received_power_variance = (
-            statistics.variance(signal_qualities) + 0.01
+            signal_qualities.var(ddof=1) + 0.01
             if len(signal_qualities) >= 2
             else 1
         )
@@ -90,27 +120,15 @@ class Plan:
 
         efficiency = self.max_transceivers / self.no_of_transceivers
 
-        return 3 * coverage + efficiency - 0.5 * effective_rssi
+        return float(coverage), float(-effective_rssi), float(efficiency)
 
     def determine_received_power(self, router, user) -> float:
-        transmit_power = router[0]
-        router = router[1:]
-
-        distance = math.dist(router, user)
-        path_loss = self.propagation_model.run(distance)
-        for wall in self.walls:
-            point_1, point_2, wall_type = wall
-            if segment_intersect([point_1, point_2], [router, user]):
-                path_loss += wall_type
-        received_power = (
-                transmit_power
-                + self.transceiver_antenna_gain
-                - path_loss
-                + self.user_device_antenna_gain
-        )
-        return received_power
+        return float(self.received_power_matrix([router], [user])[0, 0])
 
     def plot(self, name: str = None):
+        import matplotlib.pyplot as plt
+        from adjustText import adjust_text
+
         fig, ax = plt.subplots()
         ax.set_xlim([0, self.w])
         ax.set_ylim([0, self.h])
@@ -149,7 +167,7 @@ class Plan:
 
         adjust_text(texts, lim=10000)
 
-        for wall in self.walls:
+        for wall in self.floor_plan.walls:
             point1, point2, wall_type = wall
 
             x_values = [point1[0], point2[0]]
@@ -190,7 +208,8 @@ if __name__ == "__main__":
         5.180,
         3,
         1,
-        [[(15, 4), (15, 1), WALL_TYPE.CONCRETE]],
+        -50,
+        FloorPlan([[(15, 4), (15, 1), WALL_TYPE.CONCRETE]]),
     )
     plan.evaluate()
     plan.plot("plot-analysis-1")
@@ -1,151 +1,54 @@
+import numpy as np
+
+from examples.wifi_coverage.floor_plan import FloorPlan
 from examples.wifi_coverage.plan import Plan, WALL_TYPE
+from examples.wifi_coverage.scenarios import SCENARIOS
 from genetic_algorithm import GeneticAlgorithm, SelectionMethods, ReplacementMethod
-
-# # # Scenario 1.1
-# # Problem Parameters
-# TARGETS = [(5, 2.5), (20, 2.5)]
-# # Transceiver Configuration
-# MAX_TRANSCEIVERS = 2
-# MAX_TRANSCEIVER_POWER = 3  # dBm
-# TRANSCEIVER_ANTENNA_GAIN = 3  # dBi
-# USER_DEVICE_ANTENNA_GAIN = 1  # dBi
-# DESIRED_RECEIVED_POWER = -50
-# DIMENSIONS = 30, 5  # m
-# OPERATING_FREQUENCY = 5.180  # GHz
-# WALLS = []
-
-
-# # # Scenario 1.2
-# # Problem Parameters
-# TARGETS = [(5, 2.5), (20, 2.5)]
-# # Transceiver Configuration
-# MAX_TRANSCEIVERS = 2
-# MAX_TRANSCEIVER_POWER = 10  # dBm
-# TRANSCEIVER_ANTENNA_GAIN = 3  # dBi
-# USER_DEVICE_ANTENNA_GAIN = 1  # dBi
-# DESIRED_RECEIVED_POWER = -50
-# DIMENSIONS = 30, 5
-# OPERATING_FREQUENCY = 5.180
-# WALLS = []
-
-
-# # # Scenario 1.3
-# # Problem Parameters
-# TARGETS = [(5, 2.5), (20, 2.5)]
-# # Transceiver Configuration
-# MAX_TRANSCEIVERS = 2
-# MAX_TRANSCEIVER_POWER = 10  # dBm
-# TRANSCEIVER_ANTENNA_GAIN = 3  # dBi
-# USER_DEVICE_ANTENNA_GAIN = 1  # dBi
-# DESIRED_RECEIVED_POWER = -50
-# DIMENSIONS = 30, 5
-# OPERATING_FREQUENCY = 5.180
-# WALLS = [[(15, 4), (15, 1), WALL_TYPE.CONCRETE]]
-
-
-# # # Scenario 2.1
-# # Problem Parameters
-# TARGETS = [(3, 6), (7, 1)]
-# # Transceiver Configuration
-# MAX_TRANSCEIVERS = 2
-# MAX_TRANSCEIVER_POWER = 10  # dBm
-# TRANSCEIVER_ANTENNA_GAIN = 3  # dBi
-# USER_DEVICE_ANTENNA_GAIN = 1  # dBi
-# DESIRED_RECEIVED_POWER = -50
-# DIMENSIONS = 8, 7
-# OPERATING_FREQUENCY = 5.180
-# WALLS = [
-#     [(1, 5), (2, 5), WALL_TYPE.CHIP_BOARD],
-#     [(0, 5), (1, 5), WALL_TYPE.CONCRETE],
-#     #
-#     [(3, 4), (6, 4), WALL_TYPE.CONCRETE],
-#     [(2, 4), (3, 4), WALL_TYPE.CHIP_BOARD],
-#     #
-#     [(3, 4), (6, 4), WALL_TYPE.CONCRETE],
-#     [(6, 4), (6, 7), WALL_TYPE.CONCRETE],
-#     [(2, 4), (2, 7), WALL_TYPE.CONCRETE],
-#     #
-#     [(5, 0), (5, 3), WALL_TYPE.DRY_WALL],
-#     [(2, 0), (2, 3), WALL_TYPE.DRY_WALL],
-# ]
-
-
-# # # Scenario 2.2
-# # Problem Parameters
-# TARGETS = [(3, 6), (7, 1)]
-# # Transceiver Configuration
-# MAX_TRANSCEIVERS = 2
-# MAX_TRANSCEIVER_POWER = 20  # dBm
-# TRANSCEIVER_ANTENNA_GAIN = 3  # dBi
-# USER_DEVICE_ANTENNA_GAIN = 1  # dBi
-# DESIRED_RECEIVED_POWER = -50
-# DIMENSIONS = 8, 7
-# OPERATING_FREQUENCY = 5.180
-# WALLS = [
-#     [(1, 5), (2, 5), WALL_TYPE.CHIP_BOARD],
-#     [(0, 5), (1, 5), WALL_TYPE.CONCRETE],
-#     #
-#     [(3, 4), (6, 4), WALL_TYPE.CONCRETE],
-#     [(2, 4), (3, 4), WALL_TYPE.CHIP_BOARD],
-#     #
-#     [(3, 4), (6, 4), WALL_TYPE.CONCRETE],
-#     [(6, 4), (6, 7), WALL_TYPE.CONCRETE],
-#     [(2, 4), (2, 7), WALL_TYPE.CONCRETE],
-#     #
-#     [(5, 0), (5, 3), WALL_TYPE.DRY_WALL],
-#     [(2, 0), (2, 3), WALL_TYPE.DRY_WALL],
-# ]
-
-
-# # Scenario 3
+from genetic_algorithm.multiobjective import MultiObjectiveGeneticAlgorithm
+from genetic_algorithm.reporting import ProgressBar, configure_logging
+from genetic_algorithm.stopping import Stagnation
+from genetic_algorithm.telemetry import JSONLinesSink, plot_telemetry
+
+# Scenario 3; the others are in SCENARIOS, or run them all with
+# python -m genetic_algorithm.sweep examples/wifi_coverage/sweep.toml
+SCENARIO = SCENARIOS["3"]
 # Problem Parameters
-TARGETS = [(3, 3), (16, 3), (3, 9), (6, 9), (11, 9), (13, 9), (18, 9)]
+TARGETS = SCENARIO["targets"]
 # Transceiver Configuration
-MAX_TRANSCEIVERS = 2
-MAX_TRANSCEIVER_POWER = 20  # dBm
-TRANSCEIVER_ANTENNA_GAIN = 3  # dBi
-USER_DEVICE_ANTENNA_GAIN = 1  # dBi
-DESIRED_RECEIVED_POWER = -50
-DIMENSIONS = 20, 10
-OPERATING_FREQUENCY = 5.180
-WALLS = [
-    [(5, 1), (5, 6), WALL_TYPE.CHIP_BOARD],
-    [(10, 1), (10, 6), WALL_TYPE.CHIP_BOARD],
-    [(15, 1), (15, 6), WALL_TYPE.CHIP_BOARD],
-    [(2, 8), (2, 10), WALL_TYPE.DRY_WALL],
-    [(2, 8), (3, 8), WALL_TYPE.CHIP_BOARD],
-    [(3, 8), (4, 8), WALL_TYPE.DRY_WALL],
-    [(4, 8), (4, 10), WALL_TYPE.DRY_WALL],
-    [(4, 8), (5, 8), WALL_TYPE.CHIP_BOARD],
-    [(5, 8), (7, 8), WALL_TYPE.DRY_WALL],
-    [(7, 8), (7, 10), WALL_TYPE.DRY_WALL],
-    [(10, 8), (10, 10), WALL_TYPE.DRY_WALL],
-    [(10, 8), (11, 8), WALL_TYPE.CHIP_BOARD],
-    [(11, 8), (15, 8), WALL_TYPE.DRY_WALL],
-    [(12, 8), (13, 8), WALL_TYPE.CHIP_BOARD],
-    [(13, 8), (15, 8), WALL_TYPE.DRY_WALL],
-    [(12, 8), (12, 10), WALL_TYPE.DRY_WALL],
-    [(15, 8), (15, 10), WALL_TYPE.DRY_WALL],
-    [(15, 8), (16, 8), WALL_TYPE.CHIP_BOARD],
-    [(16, 8), (20, 8), WALL_TYPE.DRY_WALL],
-    [(4, 4), (6, 4), WALL_TYPE.CHIP_BOARD],
-    [(14, 4), (16, 4), WALL_TYPE.CHIP_BOARD],
-]
-
-
-def _gene_space() -> list:
+MAX_TRANSCEIVERS = SCENARIO["max_transceivers"]
+MAX_TRANSCEIVER_POWER = SCENARIO["max_transceiver_power"]  # dBm
+TRANSCEIVER_ANTENNA_GAIN = SCENARIO["transceiver_antenna_gain"]  # dBi
+USER_DEVICE_ANTENNA_GAIN = SCENARIO["user_device_antenna_gain"]  # dBi
+DESIRED_RECEIVED_POWER = SCENARIO["desired_received_power"]
+DIMENSIONS = SCENARIO["dimensions"]
+OPERATING_FREQUENCY = SCENARIO["operating_frequency"]
+WALLS = SCENARIO["walls"]
+
+FLOOR_PLAN = FloorPlan(WALLS)
+# incremental evaluation only pays for its bookkeeping once a plan's path
+# loss matrix costs at least this many wall x user x transceiver crossings
+INCREMENTAL_PATH_LOSS_WORK = 1000
+
+
+def _gene_space(max_transceivers: int = MAX_TRANSCEIVERS, max_transceiver_power: int = MAX_TRANSCEIVER_POWER,
+                dimensions: tuple = DIMENSIONS) -> list:
     # router = range, x, y
     # gene = max_routers, [router]
-    definition = [(int, 1, MAX_TRANSCEIVERS)]
-    w, h = DIMENSIONS
-    definition += MAX_TRANSCEIVERS * [
-        (int, 1, MAX_TRANSCEIVER_POWER),
+    definition = [(int, 1, max_transceivers)]
+    w, h = dimensions
+    definition += max_transceivers * [
+        (int, 1, max_transceiver_power),
         (float, 0, w),
         (float, 0, h),
     ]
     return definition
 
 
+def _positions(chromosome: list) -> np.ndarray:
+    # (x, y) of every transceiver slot
+    return np.asarray(chromosome[1:], dtype=float).reshape(-1, 3)[:, 1:]
+
+
 class WiFiCoverageGeneticAlgorithm(GeneticAlgorithm):
     """
     Maximise target coverage
@@ -159,39 +62,111 @@ class WiFiCoverageGeneticAlgorithm(GeneticAlgorithm):
     population_size = 100
     selection_method = SelectionMethods.tournament_selection
     replacement_method = ReplacementMethod.WEAK_INDIVIDUALS
+    stopping_criteria = [Stagnation(50)]
     gene_space = _gene_space()
 
+    targets = TARGETS
+    dimensions = DIMENSIONS
+    max_transceivers = MAX_TRANSCEIVERS
+    operating_frequency = OPERATING_FREQUENCY
+    transceiver_antenna_gain = TRANSCEIVER_ANTENNA_GAIN
+    user_device_antenna_gain = USER_DEVICE_ANTENNA_GAIN
+    desired_received_power = DESIRED_RECEIVED_POWER
+    floor_plan = FLOOR_PLAN
+
+    @classmethod
+    def prepare_scenario(cls, preset: str = None, walls: list = None, **parameters) -> dict:
+        """
+        Class attributes for one scenario: a preset from SCENARIOS with any
+        parameter overridden. Wall types may be given by WALL_TYPE name. The
+        FloorPlan is built here, once for every run of the scenario, and
+        incremental evaluation is turned on for plans with enough walls,
+        users and transceivers to gain from it.
+        """
+        scenario = dict(SCENARIOS[preset]) if preset else {}
+        scenario.update(parameters)
+        if walls is not None:
+            scenario["walls"] = walls
+        missing = set(SCENARIOS["3"]) - set(scenario)
+        if missing:
+            raise ValueError(f"Scenario is missing {sorted(missing)}")
+
+        walls = [
+            [tuple(point_1), tuple(point_2), getattr(WALL_TYPE, wall_type) if isinstance(wall_type, str) else wall_type]
+            for point_1, point_2, wall_type in scenario.pop("walls")
+        ]
+        scenario["targets"] = [tuple(target) for target in scenario["targets"]]
+        scenario["dimensions"] = tuple(scenario["dimensions"])
+        scenario["gene_space"] = _gene_space(
+            scenario["max_transceivers"], scenario.pop("max_transceiver_power"), scenario["dimensions"]
+        )
+        scenario["floor_plan"] = FloorPlan(walls)
+        path_loss_work = len(walls) * len(scenario["targets"]) * scenario["max_transceivers"]
+        scenario["partials_cache_size"] = None if path_loss_work >= INCREMENTAL_PATH_LOSS_WORK else 0
+        return scenario
+
     def fitness_func(self, chromosome: list) -> float:
-        plan = Plan(
+        return self.score(self.plan(chromosome))
+
+    def score(self, plan: Plan, path_loss: np.ndarray = None) -> float:
+        return plan.evaluate(path_loss)
+
+    def fitness_partials(self, chromosome: list) -> tuple:
+        return self.update_fitness_partials(chromosome, np.arange(len(chromosome)), None)
+
+    def update_fitness_partials(self, chromosome: list, changed: np.ndarray, path_loss: np.ndarray) -> tuple:
+        # one path loss row per transceiver slot, NaN until the slot is in
+        # use: moving a transceiver recomputes its row, a new power or
+        # transceiver count none at all
+        plan = self.plan(chromosome)
+        if path_loss is None:
+            path_loss = np.full((self.max_transceivers, len(self.targets)), np.nan)
+        else:
+            path_loss = path_loss.copy()
+        # genes 2 + 3r and 3 + 3r are the position of transceiver r
+        changed = changed[changed > 0] - 1
+        path_loss[changed[changed % 3 != 0] // 3] = np.nan
+
+        active = path_loss[:plan.no_of_transceivers]
+        stale = np.flatnonzero(np.isnan(active).any(axis=1))
+        if len(stale):
+            active[stale] = plan.path_loss_matrix(_positions(chromosome)[stale])
+        return self.score(plan, active), path_loss
+
+    def plan(self, chromosome: list) -> Plan:
+        return Plan(
             chromosome,
-            TARGETS,
-            DIMENSIONS,
-            MAX_TRANSCEIVERS,
-            OPERATING_FREQUENCY,
-            TRANSCEIVER_ANTENNA_GAIN,
-            USER_DEVICE_ANTENNA_GAIN,
-            DESIRED_RECEIVED_POWER,
-            WALLS,
+            self.targets,
+            self.dimensions,
+            self.max_transceivers,
+            self.operating_frequency,
+            self.transceiver_antenna_gain,
+            self.user_device_antenna_gain,
+            self.desired_received_power,
+            self.floor_plan,
         )
-        return plan.evaluate()
+
+
+class WiFiCoverageMultiObjectiveGeneticAlgorithm(MultiObjectiveGeneticAlgorithm, WiFiCoverageGeneticAlgorithm):
+    """
+    Coverage, signal quality and efficiency kept apart; the weights are the
+    ones WiFiCoverageGeneticAlgorithm folds them into a single fitness with
+    """
+    objective_weights = (3, 0.5, 1)
+
+    def score(self, plan: Plan, path_loss: np.ndarray = None) -> tuple:
+        return plan.objectives(path_loss)
 
 
 if __name__ == "__main__":
+    configure_logging()
     ga = WiFiCoverageGeneticAlgorithm()
+    ga.reporters = [ProgressBar(), JSONLinesSink("telemetry.jsonl")]
     ga.run()
+    plot_telemetry("telemetry.jsonl")
 
     best_individual = ga.population[0]
 
-    _, chromosome, _ = best_individual
-    plan = Plan(
-        chromosome,
-        TARGETS,
-        DIMENSIONS,
-        MAX_TRANSCEIVERS,
-        OPERATING_FREQUENCY,
-        TRANSCEIVER_ANTENNA_GAIN,
-        USER_DEVICE_ANTENNA_GAIN,
-        DESIRED_RECEIVED_POWER,
-        WALLS,
-    )
+    chromosome = ga.decode(best_individual.genes)
+    plan = ga.plan(chromosome)
     plan.plot()
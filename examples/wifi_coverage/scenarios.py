@@ -0,0 +1,120 @@
+from examples.wifi_coverage.plan import WALL_TYPE
+
+# Problem and transceiver parameters of each scenario; powers in dBm, gains
+# in dBi, dimensions in m and the operating frequency in GHz
+SCENARIOS = {
+    "1.1": dict(
+        targets=[(5, 2.5), (20, 2.5)],
+        max_transceivers=2,
+        max_transceiver_power=3,
+        transceiver_antenna_gain=3,
+        user_device_antenna_gain=1,
+        desired_received_power=-50,
+        dimensions=(30, 5),
+        operating_frequency=5.180,
+        walls=[],
+    ),
+    "1.2": dict(
+        targets=[(5, 2.5), (20, 2.5)],
+        max_transceivers=2,
+        max_transceiver_power=10,
+        transceiver_antenna_gain=3,
+        user_device_antenna_gain=1,
+        desired_received_power=-50,
+        dimensions=(30, 5),
+        operating_frequency=5.180,
+        walls=[],
+    ),
+    "1.3": dict(
+        targets=[(5, 2.5), (20, 2.5)],
+        max_transceivers=2,
+        max_transceiver_power=10,
+        transceiver_antenna_gain=3,
+        user_device_antenna_gain=1,
+        desired_received_power=-50,
+        dimensions=(30, 5),
+        operating_frequency=5.180,
+        walls=[[(15, 4), (15, 1), WALL_TYPE.CONCRETE]],
+    ),
+    "2.1": dict(
+        targets=[(3, 6), (7, 1)],
+        max_transceivers=2,
+        max_transceiver_power=10,
+        transceiver_antenna_gain=3,
+        user_device_antenna_gain=1,
+        desired_received_power=-50,
+        dimensions=(8, 7),
+        operating_frequency=5.180,
+        walls=[
+            [(1, 5), (2, 5), WALL_TYPE.CHIP_BOARD],
+            [(0, 5), (1, 5), WALL_TYPE.CONCRETE],
+            #
+            [(3, 4), (6, 4), WALL_TYPE.CONCRETE],
+            [(2, 4), (3, 4), WALL_TYPE.CHIP_BOARD],
+            #
+            [(3, 4), (6, 4), WALL_TYPE.CONCRETE],
+            [(6, 4), (6, 7), WALL_TYPE.CONCRETE],
+            [(2, 4), (2, 7), WALL_TYPE.CONCRETE],
+            #
+            [(5, 0), (5, 3), WALL_TYPE.DRY_WALL],
+            [(2, 0), (2, 3), WALL_TYPE.DRY_WALL],
+        ],
+    ),
+    "2.2": dict(
+        targets=[(3, 6), (7, 1)],
+        max_transceivers=2,
+        max_transceiver_power=20,
+        transceiver_antenna_gain=3,
+        user_device_antenna_gain=1,
+        desired_received_power=-50,
+        dimensions=(8, 7),
+        operating_frequency=5.180,
+        walls=[
+            [(1, 5), (2, 5), WALL_TYPE.CHIP_BOARD],
+            [(0, 5), (1, 5), WALL_TYPE.CONCRETE],
+            #
+            [(3, 4), (6, 4), WALL_TYPE.CONCRETE],
+            [(2, 4), (3, 4), WALL_TYPE.CHIP_BOARD],
+            #
+            [(3, 4), (6, 4), WALL_TYPE.CONCRETE],
+            [(6, 4), (6, 7), WALL_TYPE.CONCRETE],
+            [(2, 4), (2, 7), WALL_TYPE.CONCRETE],
+            #
+            [(5, 0), (5, 3), WALL_TYPE.DRY_WALL],
+            [(2, 0), (2, 3), WALL_TYPE.DRY_WALL],
+        ],
+    ),
+    "3": dict(
+        targets=[(3, 3), (16, 3), (3, 9), (6, 9), (11, 9), (13, 9), (18, 9)],
+        max_transceivers=2,
+        max_transceiver_power=20,
+        transceiver_antenna_gain=3,
+        user_device_antenna_gain=1,
+        desired_received_power=-50,
+        dimensions=(20, 10),
+        operating_frequency=5.180,
+        walls=[
+            [(5, 1), (5, 6), WALL_TYPE.CHIP_BOARD],
+            [(10, 1), (10, 6), WALL_TYPE.CHIP_BOARD],
+            [(15, 1), (15, 6), WALL_TYPE.CHIP_BOARD],
+            [(2, 8), (2, 10), WALL_TYPE.DRY_WALL],
+            [(2, 8), (3, 8), WALL_TYPE.CHIP_BOARD],
+            [(3, 8), (4, 8), WALL_TYPE.DRY_WALL],
+            [(4, 8), (4, 10), WALL_TYPE.DRY_WALL],
+            [(4, 8), (5, 8), WALL_TYPE.CHIP_BOARD],
+            [(5, 8), (7, 8), WALL_TYPE.DRY_WALL],
+            [(7, 8), (7, 10), WALL_TYPE.DRY_WALL],
+            [(10, 8), (10, 10), WALL_TYPE.DRY_WALL],
+            [(10, 8), (11, 8), WALL_TYPE.CHIP_BOARD],
+            [(11, 8), (15, 8), WALL_TYPE.DRY_WALL],
+            [(12, 8), (13, 8), WALL_TYPE.CHIP_BOARD],
+            [(13, 8), (15, 8), WALL_TYPE.DRY_WALL],
+            [(12, 8), (12, 10), WALL_TYPE.DRY_WALL],
+            [(15, 8), (15, 10), WALL_TYPE.DRY_WALL],
+            [(15, 8), (16, 8), WALL_TYPE.CHIP_BOARD],
+            [(16, 8), (20, 8), WALL_TYPE.DRY_WALL],
+            [(4, 4), (6, 4), WALL_TYPE.CHIP_BOARD],
+            [(14, 4), (16, 4), WALL_TYPE.CHIP_BOARD],
+        ],
+    ),
+}
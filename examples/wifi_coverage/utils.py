@@ -1,5 +1,6 @@
 import math
 
+import numpy as np
 from shapely import LineString
 
 
@@ -25,26 +26,32 @@ class PropagationModel:
         # 2D distance between Tx and Rx (m)
         return 0.0
 
+    def run_many(self, distances) -> np.ndarray:
+        # models override this with array maths, the fallback loops over run
+        distances = np.asarray(distances, dtype=float)
+        return np.array([self.run(distance) for distance in distances.ravel()]).reshape(distances.shape)
+
 
 class ITUP1238IndoorPropagationModel(PropagationModel):
+    alpha = 1.46
+    beta = 34.62
+    gamma = 2.03
+
     def __init__(self, args):
         super().__init__(args)
         self.distance_power_loss_coefficient = 18.4
         self.floor_penetration_loss_factor = 0
         self.num_floors = 0
+        # the frequency term does not depend on distance
+        self.frequency_loss = self.beta + 10 * self.gamma * math.log10(self.frequency)
 
     def plot_name(self):
         return f"{super().plot_name()},N={self.distance_power_loss_coefficient},L_f={self.floor_penetration_loss_factor},f={self.num_floors} "
 
     def run(self, distance: float) -> float:
         distance += 0.0001
+        return 10 * self.alpha * math.log10(distance) + self.frequency_loss
 
-        alpha = 1.46
-        beta = 34.62
-        gamma = 2.03
-
-        return (
-                10 * alpha * math.log10(distance)
-                + beta
-                + 10 * gamma * math.log10(self.frequency)
-        )
+    def run_many(self, distances) -> np.ndarray:
+        distances = np.asarray(distances, dtype=float) + 0.0001
+        return 10 * self.alpha * np.log10(distances) + self.frequency_loss
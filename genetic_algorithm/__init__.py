@@ -1,15 +1,28 @@
+import copy
+import itertools
 import logging
+import math
 import random
 import time
-import uuid
 from abc import abstractmethod, ABC
+from array import array
+from collections import defaultdict
 from enum import Enum, auto
 from typing import Callable
 
-import enlighten
-import matplotlib.pyplot as plt
+import numpy as np
+
+from genetic_algorithm import selection
+from genetic_algorithm.cache import FitnessCache, MISSING
+from genetic_algorithm.crossover import SinglePointCrossover, crossover, crossover_operator
+from genetic_algorithm.checkpoint import Checkpoint, load_checkpoint
+from genetic_algorithm.capacity import EvictionMethod, crowding_distance, individual_nbytes
+from genetic_algorithm.evaluation import SerialEvaluator, ThreadPoolEvaluator, ProcessPoolEvaluator
+from genetic_algorithm.individual import Individual, gene_typecode
+from genetic_algorithm.mutation import mutate, mutation_plan
+from genetic_algorithm.stats import PopulationStats, gene_diversity
+from genetic_algorithm.reporting import Reporter, ProgressBar, FitnessGraph, configure_logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -21,54 +34,233 @@ class ReplacementMethod(Enum):
     NO_REPLACEMENT = auto()
 
 
-class CrossoverMethod:
+class SelectionMethods:
+    """
+    Parents are picked by index over the population's fitness vector; the
+    number picked is rounded up to even so every parent has a partner.
+    """
+
     @staticmethod
-    def single_point_crossover(parents: list, gene_space: list):
-        children = []
-        crossover_point = random.randint(0, len(gene_space) - 1)
-        for i in range(0, len(parents), 2):
-            _, parent1, _ = parents[i]
-            _, parent2, _ = parents[i + 1]
-            child1 = parent1[:crossover_point] + parent2[crossover_point:]
-            child2 = parent2[:crossover_point] + parent1[crossover_point:]
-            children.append(child1)
-            children.append(child2)
-        return children
+    def tournament_selection(cls, population: list, num_of_parents: int, **kwargs) -> list:
+        # the two best of each tournament become a pair of parents
+        size = cls.tournament_size or int(0.2 * len(population))
+        winners = selection.tournament(
+            _fitness_vector(population), math.ceil(num_of_parents / 2), size, _rng(), winners=2
+        )
+        return [population[i] for i in winners.ravel()]
 
+    @staticmethod
+    def roulette_wheel_selection(cls, population: list, num_of_parents: int, **kwargs) -> list:
+        indices = selection.roulette_wheel(_fitness_vector(population), _even(num_of_parents), _rng())
+        return [population[i] for i in indices]
 
-class SelectionMethods:
     @staticmethod
-    def tournament_selection(cls, population: list, num_of_parents: int, **kwargs) -> list:
-        parents = []
-        for _ in range(0, num_of_parents, 2):
-            # tournament_size is 20% of the population
-            winners = random.choices(population, k=int(0.2 * len(population)))
-            winners = sorted(
-                winners, key=lambda individual: individual[2], reverse=True
-            )
-            parents.append(winners[0])
-            parents.append(winners[1])
+    def stochastic_universal_sampling(cls, population: list, num_of_parents: int, **kwargs) -> list:
+        indices = selection.stochastic_universal_sampling(
+            _fitness_vector(population), _even(num_of_parents), _rng()
+        )
+        return [population[i] for i in indices]
+
+    @staticmethod
+    def rank_selection(cls, population: list, num_of_parents: int, **kwargs) -> list:
+        indices = selection.rank(_fitness_vector(population), _even(num_of_parents), _rng())
+        return [population[i] for i in indices]
+
 
-        return parents
+def _fitness_vector(population: list) -> np.ndarray:
+    return np.fromiter((individual.fitness for individual in population), dtype=float, count=len(population))
+
+
+def _even(n: int) -> int:
+    return n + n % 2
+
+
+def _rng() -> np.random.Generator:
+    # drawn from the random module so reseed() and checkpoints cover selection too
+    return np.random.default_rng(random.getrandbits(64))
 
 
 class GeneticAlgorithm(ABC):
     population = []
+    # maximum number of memoised fitness values, 0 disables the cache
+    fitness_cache_size = 10000
+    # chromosomes whose partial results are kept for incremental evaluation, see
+    # fitness_partials; opt-in, 0 disables it and None keeps population_size of them
+    partials_cache_size = 0
+    # e.g. ProcessPoolEvaluator(max_workers=32), each instance gets its own copy
+    evaluator = None
+    # opt-in, e.g. [ProgressBar(), FitnessGraph()]
+    reporters = ()
+    # end the run early, e.g. [Stagnation(50), WallClock(600)], see genetic_algorithm.stopping
+    stopping_criteria = ()
+    # population cap in individuals and/or bytes, None leaves it unbounded
+    max_population_size = None
+    population_memory_budget = None
+    eviction_method = EvictionMethod.WORST_FITNESS
+    # contenders per tournament, None for 20% of the population
+    tournament_size = None
+    # a registered name, an operator or one per gene, see genetic_algorithm.mutation
+    mutation_operators = None
+    # a registered name or an operator, see genetic_algorithm.crossover
+    crossover_operator = None
+    # e.g. SurrogateScreen("knn", fraction=0.25), see genetic_algorithm.surrogate
+    surrogate = None
+    # runtime state that is not shipped to evaluator worker processes
+    _transient_state = (
+        "population", "_slots", "stats", "fitness_graph", "fitness_cache", "partials_cache", "evaluator", "surrogate",
+        "reporters",
+    )
 
     def __init__(self, *args, **kwargs):
-        pass
-
-    def _calculate_fitness(self):
-        for i in range(len(self.population)):
-            id, gene, fitness = self.population[i]
-            fitness = self.fitness_func(gene)
-            individual = id, gene, fitness
-            self.population[i] = individual
+        self.population = []
+        # id -> position in population, kept in step by _append/_place/_swap_remove
+        self._slots = {}
+        # fitness statistics of the scored members of the population
+        self.stats = PopulationStats()
+        # generations completed so far and the [generation, best_fitness] history
+        self.generation = 0
+        self.fitness_graph = []
+        # fitness_func calls so far and the seconds spent in each phase this generation
+        self.evaluations = 0
+        self.phase_seconds = defaultdict(float)
+        # fitness_func calls and seconds per call site (the phase that asked for them)
+        self.fitness_calls = defaultdict(int)
+        self.fitness_seconds = defaultdict(float)
+        self._phase = None
+        self.fitness_cache = FitnessCache(self.fitness_cache_size)
+        # chromosome -> fitness_partials() state, for children of these chromosomes
+        self.partials_cache = FitnessCache(
+            self.population_size if self.partials_cache_size is None else self.partials_cache_size
+        )
+        self.evaluator = copy.copy(self.evaluator) if self.evaluator else SerialEvaluator()
+        # partial results stay in this process, so a parallel evaluator takes precedence
+        self.incremental = (
+            self.partials_cache_size != 0
+            and type(self).fitness_partials is not GeneticAlgorithm.fitness_partials
+            and type(self.evaluator) is SerialEvaluator
+        )
+        # evaluations done by update_fitness_partials rather than from scratch
+        self.delta_evaluations = 0
+        self.stopping_criteria = [copy.copy(criterion) for criterion in self.stopping_criteria]
+        self.stop_reason = None
+        self.gene_typecode = gene_typecode(self.gene_space)
+        self._float_stored_int_genes = [
+            j for j, (gene_type, _, _) in enumerate(self.gene_space) if gene_type == int
+        ] if self.gene_typecode == "d" else []
+        self.lower = np.array([min for _, min, _ in self.gene_space], dtype=float)
+        self.upper = np.array([max for _, _, max in self.gene_space], dtype=float)
+        self.integer = np.array([gene_type == int for gene_type, _, _ in self.gene_space])
+        self._mutation_plan = mutation_plan(self.mutation_operators, self.gene_space)
+        self._crossover_operator = crossover_operator(self.crossover_operator)
+        # each instance trains its own surrogate
+        self.surrogate = copy.deepcopy(self.surrogate)
+        if self.surrogate:
+            self.surrogate.start(self.lower, self.upper)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in self._transient_state:
+            state.pop(name, None)
+        return state
+
+    def new_individual(self, chromosome, fitness: float = None) -> Individual:
+        # immigrants from a vectorized island arrive as float64 rows whatever the gene types
+        return Individual(array(self.gene_typecode, np.asarray(chromosome).astype(self.gene_typecode)), fitness)
+
+    def decode(self, genes) -> list:
+        # the plain chromosome list handed to fitness_func
+        chromosome = list(genes)
+        for j in self._float_stored_int_genes:
+            chromosome[j] = int(chromosome[j])
+        return chromosome
+
+    def evaluate(self, chromosome: list) -> float:
+        return self.evaluate_many([chromosome])[0]
+
+    def evaluate_many(self, chromosomes: list, parents: list = None) -> list:
+        # fitness_func is assumed to be deterministic in the chromosome;
+        # parents[i], when given, is the chromosome chromosomes[i] was bred from
+        keys = [tuple(chromosome) for chromosome in chromosomes]
+        fitness = [self.fitness_cache.get(key) for key in keys]
+
+        pending = {}
+        for i, key in enumerate(keys):
+            if fitness[i] is MISSING:
+                pending.setdefault(key, []).append(i)
+        if not pending:
+            return fitness
+
+        batch = [self.decode(chromosomes[indices[0]]) for indices in pending.values()]
+        start = time.perf_counter()
+        if self.incremental:
+            results = self._evaluate_partials(
+                list(pending), batch, [parents[indices[0]] for indices in pending.values()] if parents else None
+            )
+        else:
+            results = self._evaluate_batch(batch)
+        self._record_fitness_calls(len(batch), time.perf_counter() - start)
+        if self.surrogate:
+            self.surrogate.observe(batch, results)
+        for (key, indices), value in zip(pending.items(), results):
+            self.fitness_cache.put(key, value)
+            for i in indices:
+                fitness[i] = value
+        return fitness
+
+    def _evaluate_batch(self, chromosomes: list) -> list:
+        if self.evaluator.fitness_func is None:
+            self.evaluator.start(self.fitness_func)
+        return self.evaluator.map(chromosomes)
+
+    def _evaluate_partials(self, keys: list, chromosomes: list, parents: list = None) -> list:
+        fitness = []
+        for i, (key, chromosome) in enumerate(zip(keys, chromosomes)):
+            partials = MISSING if parents is None else self.partials_cache.get(tuple(parents[i]))
+            if partials is MISSING:
+                value, partials = self.fitness_partials(chromosome)
+            else:
+                changed = np.flatnonzero(np.asarray(key) != np.asarray(parents[i]))
+                value, partials = self.update_fitness_partials(chromosome, changed, partials)
+                self.delta_evaluations += 1
+            self.partials_cache.put(key, partials)
+            fitness.append(value)
+        return fitness
+
+    def _calculate_fitness(self, individuals: list = None, parents: list = None) -> list:
+        # only individuals that are new or changed carry a fitness of None;
+        # parents[i], when given, bred individuals[i]
+        if individuals is None:
+            individuals = self.population
+        pending = [i for i, individual in enumerate(individuals) if individual.fitness is None]
+        fitness = self.evaluate_many(
+            [individuals[i].genes for i in pending], [parents[i].genes for i in pending] if parents else None
+        )
+        for individual, value in zip((individuals[i] for i in pending), fitness):
+            individual.fitness = value
+            if individual.id in self._slots:
+                self.stats.add(individual.id, value)
+        return individuals
 
     @abstractmethod
     def fitness_func(self, chromosome: list):
         pass
 
+    def fitness_partials(self, chromosome: list) -> tuple:
+        """
+        Optional incremental evaluation: returns the fitness and the partial
+        results it was aggregated from, e.g. one row per component of the
+        chromosome. Implement it together with update_fitness_partials.
+        """
+        raise NotImplementedError
+
+    def update_fitness_partials(self, chromosome: list, changed: np.ndarray, partials) -> tuple:
+        """
+        Fitness and partial results of a chromosome bred from one whose
+        partials are given; `changed` holds the indices of the genes that
+        differ between them. Must not modify `partials` in place.
+        """
+        raise NotImplementedError
+
     @property
     @abstractmethod
     def gene_space(self) -> list:
@@ -88,79 +280,157 @@ class GeneticAlgorithm(ABC):
                 elif gene_type == float:
                     gene = random.uniform(min, max)
                 chromosome.append(gene)
-            self.population.append((str(uuid.uuid4()), chromosome, self.fitness_func(chromosome)))
+            self._append(self.new_individual(chromosome))
+        self._calculate_fitness()
 
     def perform_crossover(self, parents: list):
-        children = CrossoverMethod.single_point_crossover(parents, self.gene_space)
-        children = [(str(uuid.uuid4()), child, self.fitness_func(child)) for child in children]
+        # consecutive parents pair up, an odd one out is left out
+        pairs = len(parents) // 2
+        if type(self._crossover_operator) is SinglePointCrossover:
+            return self._single_point_crossover(parents[0:2 * pairs:2], parents[1:2 * pairs:2])
+        children = crossover(
+            self._gene_matrix(parents[0:2 * pairs:2]),
+            self._gene_matrix(parents[1:2 * pairs:2]),
+            self._crossover_operator,
+            self.lower,
+            self.upper,
+            self.integer,
+            _rng(),
+        )
+        return [Individual(genes) for genes in self._gene_arrays(children)]
+
+    def _single_point_crossover(self, first: list, second: list) -> list:
+        # slicing the gene arrays directly is cheaper than packing the pairs into matrices
+        length = len(self.gene_space)
+        children = []
+        for parent1, parent2 in zip(first, second):
+            point = int(random.random() * length)
+            genes1, genes2 = parent1.genes, parent2.genes
+            children.append(Individual(genes1[:point] + genes2[point:]))
+            children.append(Individual(genes2[:point] + genes1[point:]))
         return children
 
     def perform_mutation(self, children) -> list:
-        for i, child in enumerate(children):
-            id, individual, fitness = children[i]
-            for j, gene in enumerate(individual):
-                if self.mutation_rate > random.random():
-                    continue
-
-                gene_type, min, max = self.gene_space[j]
-                if gene_type == int:
-                    mutated_chromosome = gene + random.randint(-1, 1)
-                    while mutated_chromosome < min or mutated_chromosome > max:
-                        mutated_chromosome = gene + random.randint(-1, 1)
-                    gene = mutated_chromosome
-                elif gene_type == float:
-                    mutated_chromosome = gene + random.uniform(-1, 1)
-                    while mutated_chromosome < min or mutated_chromosome > max:
-                        mutated_chromosome = gene + random.uniform(-1, 1)
-                    gene = mutated_chromosome
+        # every gene of every child mutates with probability mutation_rate
+        if not children:
+            return children
+        genes = self._gene_matrix(children)
+        mutated = mutate(genes, self.mutation_rate, self._mutation_plan, self.lower, self.upper, self.integer, _rng())
 
-                individual[j] = gene
-            children[i] = (id, individual, self.fitness_func(individual))
+        for i in np.flatnonzero((mutated != genes).any(axis=1)):
+            children[i].genes = self._gene_array(mutated[i])
+            children[i].fitness = None
 
         return children
 
-    def perform_replacement(self, parents: list, children: list) -> None:
-        # TODO O(n) use hash table to make it 0(1)?
-        prune_parents = []
+    def _gene_matrix(self, individuals: list) -> np.ndarray:
+        # (individuals x genes) view of their gene storage, no per-gene boxing
+        genes = np.frombuffer(b"".join(individual.genes.tobytes() for individual in individuals), self.gene_typecode)
+        return genes.reshape(len(individuals), len(self.gene_space))
 
+    def _gene_array(self, row: np.ndarray) -> array:
+        return array(self.gene_typecode, row.astype(self.gene_typecode).tobytes())
+
+    def _gene_arrays(self, matrix: np.ndarray) -> list:
+        # one gene array per row, sliced out of a single conversion
+        genes = array(self.gene_typecode, matrix.astype(self.gene_typecode).tobytes())
+        width = matrix.shape[1]
+        return [genes[i:i + width] for i in range(0, len(genes), width)]
+
+    def perform_replacement(self, parents: list, children: list) -> None:
         if self.replacement_method == ReplacementMethod.NO_REPLACEMENT:
             for child in children:
-                self.population.append(child)
+                self._append(child)
 
         elif self.replacement_method == ReplacementMethod.RANDOM:
             for child in children:
                 random_position = random.randint(0, len(self.population) - 1)
-                self.population[random_position] = child
+                self._place(random_position, child)
 
         elif self.replacement_method == ReplacementMethod.BOTH_PARENTS:
-            for i, parent in enumerate(parents):
-                parent_idx = next(j for j, individual in enumerate(self.population) if individual[0] == parent[0])
-                prune_parents.append(parent_idx)
-                self.population.append(children[i])
+            # a parent picked more than once only has one slot to give, to its first child
+            for parent, child in zip(parents, children):
+                if parent.id in self._slots:
+                    self._place(self._slots[parent.id], child)
 
         elif self.replacement_method == ReplacementMethod.WEAK_PARENTS:
-            for child in children:
-                for parent in parents:
-                    _, child_fitness, _ = child
-                    _, parent_fitness, _ = parent
-                    if child_fitness >= parent_fitness:
-                        parent_idx = self.population.index(parent)
-                        self.population[parent_idx] = children[parent_idx]
-                        continue
+            for parent, child in zip(parents, children):
+                if parent.id in self._slots and child.fitness >= parent.fitness:
+                    self._place(self._slots[parent.id], child)
 
         elif self.replacement_method == ReplacementMethod.WEAK_INDIVIDUALS:
-            for child in children:
-                self.population.append(child)
-
-            self.population = sorted(
-                self.population,
-                key=lambda gene: gene[2],
-                reverse=True,
-            )
-            self.population = self.population[:self.population_size]
-
-        for parent in prune_parents:
-            self.population.pop(parent)
+            self._replace_weakest(children)
+
+    def _append(self, individual: Individual) -> None:
+        self._slots[individual.id] = len(self.population)
+        self.population.append(individual)
+        if individual.fitness is not None:
+            self.stats.add(individual.id, individual.fitness)
+
+    def _place(self, slot: int, individual: Individual) -> None:
+        previous = self.population[slot]
+        del self._slots[previous.id]
+        if previous.fitness is not None:
+            self.stats.remove(previous.id, previous.fitness)
+        self._slots[individual.id] = slot
+        self.population[slot] = individual
+        if individual.fitness is not None:
+            self.stats.add(individual.id, individual.fitness)
+
+    def _swap_remove(self, id: int) -> Individual:
+        slot = self._slots.pop(id)
+        individual = self.population[slot]
+        if individual.fitness is not None:
+            self.stats.remove(individual.id, individual.fitness)
+        last = self.population.pop()
+        if slot < len(self.population):
+            self.population[slot] = last
+            self._slots[last.id] = slot
+        return individual
+
+    def _reindex(self) -> None:
+        # keeps the insertion order of the ids, which AGE eviction relies on
+        slots = {individual.id: slot for slot, individual in enumerate(self.population)}
+        self._slots = {id: slots[id] for id in self._slots}
+
+    def _replace_weakest(self, children: list) -> None:
+        for child in children:
+            if len(self.population) < self.population_size:
+                self._append(child)
+            # ties keep the incumbent, as the stable sort used to
+            elif child.fitness > self.stats.worst:
+                self._place(self._slots[self.stats.weakest(1)[0]], child)
+
+        while len(self.population) > self.population_size:
+            self._swap_remove(self.stats.weakest(1)[0])
+
+    def population_capacity(self) -> int:
+        capacity = self.max_population_size
+        if self.population_memory_budget is not None and self.population:
+            affordable = self.population_memory_budget // individual_nbytes(self.population[0])
+            capacity = affordable if capacity is None else min(capacity, affordable)
+        return capacity
+
+    def _enforce_capacity(self) -> None:
+        capacity = self.population_capacity()
+        if capacity is None or len(self.population) <= capacity:
+            return
+        excess = len(self.population) - capacity
+
+        if self.eviction_method == EvictionMethod.AGE:
+            # _slots iterates in the order individuals joined the population
+            evicted = list(itertools.islice(self._slots, excess))
+
+        elif self.eviction_method == EvictionMethod.WORST_FITNESS:
+            evicted = self.stats.weakest(excess)
+
+        elif self.eviction_method == EvictionMethod.CROWDING_DISTANCE:
+            genes = np.array([individual.genes for individual in self.population])
+            crowded = np.argsort(crowding_distance(genes), kind="stable")[:excess]
+            evicted = [self.population[slot].id for slot in crowded]
+
+        for id in evicted:
+            self._swap_remove(id)
 
     def perform_selection(self) -> list:
         return self.selection_method(self.population, self.num_of_parents)
@@ -168,6 +438,7 @@ class GeneticAlgorithm(ABC):
     @property
     @abstractmethod
     def mutation_rate(self) -> float:
+        # probability that any one gene of a child is mutated
         pass
 
     @property
@@ -185,54 +456,259 @@ class GeneticAlgorithm(ABC):
     def replacement_method(self) -> ReplacementMethod:
         pass
 
-    def run(self):
-        start = time.time()
-        fitness_graph = []
-
-        self._initialise_population()
-
-        pbar = enlighten.Counter(total=self.generations, desc='Basic', unit='ticks')
-        for generation in range(self.generations):
-            pbar.update()
-
-            parents = self.perform_selection()
-            children = self.perform_crossover(parents)
-            children = self.perform_mutation(children)
+    def evolve(self) -> None:
+        parents = self._timed("selection", self.perform_selection)
+        children = self._timed("crossover", self.perform_crossover, parents)
+        children = self._timed("mutation", self.perform_mutation, children)
+        if self.surrogate:
+            parents, children = self._timed("screening", self._screen, parents, children)
+        children = self._timed("evaluation", self._calculate_fitness, children, parents)
+        if self.surrogate:
+            self.surrogate.validate([child.fitness for child in children])
+
+        self._timed("replacement", self.perform_replacement, parents, children)
+        self._timed("capacity", self._enforce_capacity)
+
+        self._timed("reevaluation", self._calculate_fitness)
+
+    def _screen(self, parents: list, children: list) -> tuple:
+        # child i came from parents i, the pairs stay together for replacement
+        known = [child.fitness is not None or tuple(child.genes) in self.fitness_cache for child in children]
+        keep = self.surrogate.screen(self._gene_matrix(children), _rng(), known)
+        return [parents[i] for i in keep], [children[i] for i in keep]
+
+    def _timed(self, phase: str, func: Callable, *args):
+        outer, self._phase = self._phase, phase
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.phase_seconds[phase] += time.perf_counter() - start
+            self._phase = outer
+
+    def _record_fitness_calls(self, calls: int, seconds: float, site: str = None) -> None:
+        site = site or self._phase or "direct"
+        self.evaluations += calls
+        self.fitness_calls[site] += calls
+        self.fitness_seconds[site] += seconds
 
-            self.perform_replacement(parents, children)
+    @property
+    def population_count(self) -> int:
+        return len(self.population)
+
+    def fitness_summary(self) -> tuple:
+        # best, worst, mean, standard deviation
+        return self.stats.best, self.stats.worst, self.stats.mean, self.stats.std
+
+    def diversity(self) -> float:
+        return gene_diversity(self._gene_matrix(self.population), self.lower, self.upper)
+
+    def generation_record(self, generation: int, seconds: float) -> dict:
+        best, worst, mean, std = self.fitness_summary()
+        record = {
+            "generation": generation,
+            "seconds": seconds,
+            "population": self.population_count,
+            "best": best,
+            "worst": worst,
+            "mean": mean,
+            "std": std,
+            # running totals
+            "evaluations": self.evaluations,
+            "cache_hits": self.fitness_cache.hits,
+            "cache_misses": self.fitness_cache.misses,
+        }
+        if self.incremental:
+            record["delta_evaluations"] = self.delta_evaluations
+        if self.surrogate:
+            record["surrogate_saved"] = self.surrogate.saved
+            record["surrogate_rank_correlation"] = self.surrogate.rank_correlation
+        for phase, phase_seconds in self.phase_seconds.items():
+            record[f"{phase}_seconds"] = phase_seconds
+        return record
+
+    def best_individual(self) -> Individual:
+        return self.population[self._slots[self.stats.best_id]]
+
+    def elite(self, k: int) -> list:
+        return [self.population[self._slots[id]] for id in self.stats.elite(k)]
+
+    def emigrants(self, k: int) -> list:
+        return [individual.genes for individual in self.elite(k)]
+
+    def immigrate(self, chromosomes: list) -> None:
+        # immigrants take the places of the weakest individuals
+        weakest = [self._slots[id] for id in self.stats.weakest(len(chromosomes))]
+        for i, chromosome in zip(weakest, chromosomes):
+            self._place(i, self.new_individual(chromosome))
+        self._calculate_fitness()
+
+    def best_fitness(self) -> float:
+        return self.stats.best
+
+    def reseed(self, seed=None) -> None:
+        random.seed(seed)
+
+    def checkpoint_state(self) -> dict:
+        state = self._population_state()
+        state["fitness_graph"] = np.array(self.fitness_graph, dtype=float).reshape(-1, 2)
+        # the cache decides which children cost an evaluation, so it is part of an exact resume
+        entries = self.fitness_cache.items()
+        state["fitness_cache_keys"] = np.array([key for key, _ in entries], dtype=float).reshape(
+            len(entries), len(self.gene_space)
+        )
+        state["fitness_cache_values"] = np.array([value for _, value in entries], dtype=float)
+        if self.surrogate:
+            state.update({f"surrogate_{name}": value for name, value in self.surrogate.state().items()})
+        state["meta"] = {
+            "generation": self.generation,
+            "evaluations": self.evaluations,
+            "cache_hits": self.fitness_cache.hits,
+            "cache_misses": self.fitness_cache.misses,
+            "stopping_criteria": [criterion.state() for criterion in self.stopping_criteria],
+            "next_id": Individual.peek_id(),
+            "random_state": random.getstate(),
+        }
+        return state
+
+    def restore(self, state: dict) -> None:
+        self._restore_population(state)
+        meta = state["meta"]
+        self.generation = meta["generation"]
+        self.evaluations = meta["evaluations"]
+        for criterion, criterion_state in zip(self.stopping_criteria, meta["stopping_criteria"]):
+            criterion.restore(criterion_state)
+        self.fitness_graph = [[int(generation), fitness] for generation, fitness in state["fitness_graph"].tolist()]
+        self.fitness_cache.clear()
+        for key, value in zip(state["fitness_cache_keys"].tolist(), state["fitness_cache_values"].tolist()):
+            # objective vectors come back as lists
+            self.fitness_cache.put(tuple(key), tuple(value) if isinstance(value, list) else value)
+        self.fitness_cache.hits = meta["cache_hits"]
+        self.fitness_cache.misses = meta["cache_misses"]
+        if self.surrogate:
+            self.surrogate.restore(
+                {name[len("surrogate_"):]: value for name, value in state.items() if name.startswith("surrogate_")}
+            )
+        version, internal_state, gauss_next = meta["random_state"]
+        random.setstate((version, tuple(internal_state), gauss_next))
+        Individual.advance_ids(meta["next_id"])
+
+    def resume(self, path: str) -> None:
+        self.restore(load_checkpoint(path))
+
+    def _population_state(self) -> dict:
+        dtype = np.int64 if self.gene_typecode == "q" else float
+        return {
+            "ids": np.array([individual.id for individual in self.population], dtype=np.int64),
+            "genes": np.array(
+                [individual.genes for individual in self.population], dtype=dtype
+            ).reshape(len(self.population), len(self.gene_space)),
+            "fitness": np.array(
+                [np.nan if individual.fitness is None else individual.fitness for individual in self.population],
+                dtype=float,
+            ),
+            # ids in the order they joined the population
+            "joined": np.fromiter(self._slots, dtype=np.int64, count=len(self._slots)),
+        }
+
+    def _restore_population(self, state: dict) -> None:
+        self.population = [
+            Individual(array(self.gene_typecode, genes), None if math.isnan(fitness) else fitness, id)
+            for id, genes, fitness in zip(state["ids"].tolist(), state["genes"].tolist(), state["fitness"].tolist())
+        ]
+        slots = {individual.id: slot for slot, individual in enumerate(self.population)}
+        self._slots = {id: slots[id] for id in state["joined"].tolist()}
+        self.stats.clear()
+        for individual in self.population:
+            if individual.fitness is not None:
+                self.stats.add(individual.id, individual.fitness)
 
-            self._calculate_fitness()
+    def run(self):
+        self.evaluator.start(self.fitness_func)
+        try:
+            self._run()
+        finally:
+            self.evaluator.shutdown()
 
-            best_gene = sorted(
-                self.population,
-                key=lambda gene: gene[2],
-                reverse=True,
-            )[0]
-            best_fitness = best_gene[2]
-            fitness_graph.append([generation, best_fitness])
+    def _run(self):
+        start = time.time()
 
+        for reporter in self.reporters:
+            reporter.start(self)
+        self.stop_reason = None
+
+        # a resumed run carries on from its checkpointed generation, and its
+        # stopping criteria from their checkpointed state
+        if self.generation == 0:
+            for criterion in self.stopping_criteria:
+                criterion.start(self)
+            self._timed("initialisation", self._initialise_population)
+
+        while self.generation < self.generations:
+            generation = self.generation
+            generation_start = time.perf_counter()
+            self.evolve()
+            self.generation += 1
+
+            best_fitness = self.best_fitness()
+            self.fitness_graph.append([generation, best_fitness])
+
+            # checked before reporting, so a checkpoint taken by a reporter
+            # holds the criteria's state for this generation
+            for criterion in self.stopping_criteria:
+                if criterion.should_stop(self):
+                    self.stop_reason = repr(criterion)
+                    break
+
+            if self.reporters:
+                record = self.generation_record(generation, time.perf_counter() - generation_start)
+                for reporter in self.reporters:
+                    reporter.generation(self, record)
+            # initialisation time is reported with the first generation
+            self.phase_seconds.clear()
+
+            if self.stop_reason:
+                break
+
+        self.stop_reason = self.stop_reason or f"generations={self.generations}"
         end = time.time()
+        logger.info("Stopped after %d generations by %s", self.generation, self.stop_reason)
         logger.info("Took %d seconds", end - start)
+        if self.surrogate:
+            logger.info(
+                "Surrogate saved %d of %d evaluations, rank correlation %.3f",
+                self.surrogate.saved,
+                self.surrogate.candidates,
+                self.surrogate.rank_correlation,
+            )
 
-        logger.info("Individuals %d", len(self.population))
+        for reporter in self.reporters:
+            reporter.end(self, self.fitness_graph)
 
-        self.population.sort(key=lambda d: d[2], reverse=True)
+        self._log_summary()
+
+    def _log_summary(self):
+        logger.info("Individuals %d", len(self.population))
+        logger.info(
+            "Fitness best %s worst %s mean %s std %s",
+            self.stats.best,
+            self.stats.worst,
+            self.stats.mean,
+            self.stats.std,
+        )
+        logger.info(
+            "Fitness cache hits %d misses %d (%.1f%%)",
+            self.fitness_cache.hits,
+            self.fitness_cache.misses,
+            100 * self.fitness_cache.hit_rate,
+        )
+
+        self.population.sort(key=lambda individual: individual.fitness, reverse=True)
+        self._reindex()
 
         for individual in self.population[:3]:
             logger.info("Best individual %s", individual)
 
-        x_values = [row[0] for row in fitness_graph]
-        y_values = [row[1] for row in fitness_graph]
-
-        plt.plot(x_values, y_values)
-        plt.xlabel("Generation")
-        plt.ylabel("Fitness Value")
-
-        plt.title("Fitness Graph")
-        # plt.suptitle("f")
-
-        plt.savefig('fitness-graph.png')
-
     @property
     @abstractmethod
     def selection_method(self) -> Callable:
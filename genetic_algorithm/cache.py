@@ -0,0 +1,55 @@
+from collections import OrderedDict
+from typing import Optional
+
+MISSING = object()
+
+
+class FitnessCache:
+    """
+    Bounded LRU memo of fitness values keyed by chromosome content.
+    A maxsize of 0 disables caching, None makes the cache unbounded.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 10000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._store = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, key) -> bool:
+        return key in self._store
+
+    def get(self, key, default=MISSING):
+        try:
+            value = self._store[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._store.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value) -> None:
+        if self.maxsize == 0:
+            return
+        self._store[key] = value
+        self._store.move_to_end(key)
+        if self.maxsize is not None and len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+    def items(self) -> list:
+        """(key, value) pairs, least recently used first."""
+        return list(self._store.items())
+
+    def clear(self) -> None:
+        self._store.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return lookups and self.hits / lookups or 0.0
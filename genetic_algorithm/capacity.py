@@ -0,0 +1,45 @@
+import sys
+from enum import Enum, auto
+
+import numpy as np
+
+
+class EvictionMethod(Enum):
+    AGE = auto()
+    WORST_FITNESS = auto()
+    CROWDING_DISTANCE = auto()
+
+
+def crowding_distance(points: np.ndarray) -> np.ndarray:
+    """
+    NSGA-II crowding distance of each row of an (n x d) array: the summed,
+    range-normalised gap between its neighbours along every column.
+    Rows at either end of a column get an infinite distance.
+    """
+    points = np.asarray(points, dtype=float)
+    n, d = points.shape
+    distance = np.zeros(n)
+    if n < 3:
+        distance[:] = np.inf
+        return distance
+
+    order = np.argsort(points, axis=0)
+    ranked = np.take_along_axis(points, order, axis=0)
+    spread = ranked[-1] - ranked[0]
+    spread[spread == 0] = 1.0
+
+    gaps = np.empty_like(ranked)
+    gaps[1:-1] = (ranked[2:] - ranked[:-2]) / spread
+    gaps[[0, -1]] = np.inf
+    np.add.at(distance, order, gaps)
+    return distance
+
+
+def individual_nbytes(individual) -> int:
+    # the object, its gene storage and its boxed id and fitness
+    return (
+            sys.getsizeof(individual)
+            + sys.getsizeof(individual.genes)
+            + sys.getsizeof(individual.id)
+            + sys.getsizeof(individual.fitness)
+    )
@@ -0,0 +1,90 @@
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from genetic_algorithm.reporting import Reporter
+
+logger = logging.getLogger(__name__)
+
+
+def save_checkpoint(path: str, state: dict, compress: bool = False) -> int:
+    """
+    Atomically writes a state dict of NumPy arrays plus a JSON "meta" entry
+    to an .npz file and returns its size in bytes.
+    """
+    arrays = {name: value for name, value in state.items() if name != "meta"}
+    arrays["meta"] = np.array(json.dumps(state["meta"]))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        (np.savez_compressed if compress else np.savez)(f, **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+def load_checkpoint(path: str) -> dict:
+    with np.load(path, allow_pickle=False) as data:
+        state = {name: data[name] for name in data.files if name != "meta"}
+        state["meta"] = json.loads(str(data["meta"]))
+    return state
+
+
+class Checkpoint(Reporter):
+    """
+    Snapshots the algorithm every `every` generations and at the end of the
+    run. The snapshot is taken on the main loop, the file is written by a
+    background thread so evolution carries on while it is saved.
+    Resume with ga.resume(path) followed by ga.run().
+    """
+
+    def __init__(self, path: str = "checkpoint.npz", every: int = 10, compress: bool = False):
+        self.path = path
+        self.every = every
+        self.compress = compress
+        self.last_size = None
+        self.last_write_seconds = None
+        self._writer = None
+        self._pending = None
+        self._saved_generation = None
+
+    def start(self, ga) -> None:
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+
+    def generation(self, ga, record: dict) -> None:
+        if (record["generation"] + 1) % self.every == 0:
+            self.save(ga)
+
+    def end(self, ga, fitness_graph: list) -> None:
+        if self._saved_generation != ga.generation:
+            self.save(ga)
+        self.wait()
+        self._writer.shutdown()
+        self._writer = None
+
+    def save(self, ga) -> None:
+        # one write in flight at a time, a slow disk delays snapshots rather than piling them up
+        self.wait()
+        self._saved_generation = ga.generation
+        self._pending = self._writer.submit(self._write, ga.checkpoint_state())
+
+    def wait(self) -> None:
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+
+    def _write(self, state: dict) -> None:
+        start = time.perf_counter()
+        self.last_size = save_checkpoint(self.path, state, self.compress)
+        self.last_write_seconds = time.perf_counter() - start
+        logger.info(
+            "Checkpoint generation %d: %d bytes in %.3f seconds",
+            state["meta"]["generation"],
+            self.last_size,
+            self.last_write_seconds,
+        )
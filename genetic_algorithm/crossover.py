@@ -0,0 +1,104 @@
+"""
+Crossover operators over a batch of parent pairs. Each one takes the
+(pairs x genes) matrices of first and second parents and returns the two
+matrices of children, drawing a fresh point, mask or blend per pair.
+
+Operators are registered by name, so GeneticAlgorithm.crossover_operator
+can refer to them:
+
+    crossover_operator = "sbx"
+    crossover_operator = BlendCrossover(alpha=0.3)
+
+None keeps single-point crossover. The blending operators (blend, sbx)
+work on the gene values; int genes are rounded back afterwards.
+"""
+import numpy as np
+
+from genetic_algorithm.registry import Registry
+
+CROSSOVER_OPERATORS = Registry("crossover operator")
+register_crossover_operator = CROSSOVER_OPERATORS.register
+
+
+def _swap(parent1: np.ndarray, parent2: np.ndarray, mask: np.ndarray) -> tuple:
+    return np.where(mask, parent1, parent2), np.where(mask, parent2, parent1)
+
+
+@register_crossover_operator("single_point")
+class SinglePointCrossover:
+    def __call__(self, parent1, parent2, lower, upper, rng):
+        points = rng.integers(0, parent1.shape[1], size=len(parent1))
+        return _swap(parent1, parent2, np.arange(parent1.shape[1]) < points[:, None])
+
+
+@register_crossover_operator("two_point")
+class TwoPointCrossover:
+    """Swaps the genes between two points drawn per pair."""
+
+    def __call__(self, parent1, parent2, lower, upper, rng):
+        points = np.sort(rng.integers(0, parent1.shape[1] + 1, size=(len(parent1), 2)), axis=1)
+        genes = np.arange(parent1.shape[1])
+        return _swap(parent2, parent1, (genes >= points[:, :1]) & (genes < points[:, 1:]))
+
+
+@register_crossover_operator("uniform")
+class UniformCrossover:
+    """Each gene comes from either parent with probability 1/2."""
+
+    def __call__(self, parent1, parent2, lower, upper, rng):
+        return _swap(parent1, parent2, rng.random(parent1.shape) < 0.5)
+
+
+@register_crossover_operator("blend")
+class BlendCrossover:
+    """
+    BLX-alpha: children are drawn uniformly from the parents' interval,
+    widened by alpha times its length on each side and clipped to the bounds.
+    """
+
+    def __init__(self, alpha: float = 0.5):
+        self.alpha = alpha
+
+    def __call__(self, parent1, parent2, lower, upper, rng):
+        low, high = np.minimum(parent1, parent2), np.maximum(parent1, parent2)
+        extent = self.alpha * (high - low)
+        low, high = np.maximum(low - extent, lower), np.minimum(high + extent, upper)
+        return low + rng.random(parent1.shape) * (high - low), low + rng.random(parent1.shape) * (high - low)
+
+
+@register_crossover_operator("sbx")
+class SimulatedBinaryCrossover:
+    """
+    Deb's simulated binary crossover; a larger distribution index eta keeps
+    children closer to their parents.
+    """
+
+    def __init__(self, eta: float = 15.0):
+        self.eta = eta
+
+    def __call__(self, parent1, parent2, lower, upper, rng):
+        u = rng.random(parent1.shape)
+        beta = np.where(u <= 0.5, 2 * u, 1 / (2 * (1 - u))) ** (1 / (self.eta + 1))
+        child1 = 0.5 * ((1 + beta) * parent1 + (1 - beta) * parent2)
+        child2 = 0.5 * ((1 - beta) * parent1 + (1 + beta) * parent2)
+        return np.clip(child1, lower, upper), np.clip(child2, lower, upper)
+
+
+def crossover_operator(spec):
+    if spec is None:
+        return SinglePointCrossover()
+    return CROSSOVER_OPERATORS.resolve(spec)
+
+
+def crossover(parent1: np.ndarray, parent2: np.ndarray, operator, lower, upper, integer, rng) -> np.ndarray:
+    """
+    Crosses row i of parent1 with row i of parent2 and returns the children
+    interleaved, (child1, child2) of pair i at rows 2i and 2i + 1.
+    """
+    children = np.empty((2 * len(parent1), parent1.shape[1]))
+    children[0::2], children[1::2] = operator(
+        np.asarray(parent1, dtype=float), np.asarray(parent2, dtype=float), lower, upper, rng
+    )
+    if integer.any():
+        children[:, integer] = np.rint(children[:, integer])
+    return children
@@ -0,0 +1,127 @@
+import math
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+
+_worker_fitness_func = None
+
+
+def _initialise_worker(fitness_func: Callable):
+    global _worker_fitness_func
+    _worker_fitness_func = fitness_func
+
+
+def _evaluate_chunk(chromosomes: list) -> list:
+    return [_worker_fitness_func(chromosome) for chromosome in chromosomes]
+
+
+def _evaluate_one(chromosome: list):
+    return _worker_fitness_func(chromosome)
+
+
+class SerialEvaluator:
+    """
+    Scores batches of chromosomes in the calling process.
+    """
+
+    def __init__(self):
+        self.fitness_func = None
+
+    def start(self, fitness_func: Callable) -> None:
+        self.fitness_func = fitness_func
+
+    def map(self, chromosomes: list) -> list:
+        return [self.fitness_func(chromosome) for chromosome in chromosomes]
+
+    def submit(self, chromosome: list) -> Future:
+        # scored straight away, the returned future is already done
+        future = Future()
+        try:
+            future.set_result(self.fitness_func(chromosome))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self) -> None:
+        pass
+
+
+class ThreadPoolEvaluator(SerialEvaluator):
+    """
+    Scores chromosomes on a thread pool, for fitness functions that spend
+    their time outside the interpreter lock: NumPy, I/O, a simulator process.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        super().__init__()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = None
+
+    def start(self, fitness_func: Callable) -> None:
+        self.shutdown()
+        super().start(fitness_func)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fitness")
+
+    def map(self, chromosomes: list) -> list:
+        return list(self.executor.map(self.fitness_func, chromosomes))
+
+    def submit(self, chromosome: list) -> Future:
+        return self.executor.submit(self.fitness_func, chromosome)
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["executor"] = None
+        return state
+
+
+class ProcessPoolEvaluator(SerialEvaluator):
+    """
+    Scores batches of chromosomes on a process pool. The fitness function,
+    and with it the algorithm instance and any problem constants it holds
+    (walls, targets, ...), is shipped once per worker by the pool
+    initialiser; tasks only carry chunks of chromosomes.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, chunksize: Optional[int] = None, mp_context=None):
+        super().__init__()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.mp_context = mp_context
+        self.executor = None
+
+    def start(self, fitness_func: Callable) -> None:
+        self.shutdown()
+        super().start(fitness_func)
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self.mp_context or multiprocessing.get_context(),
+            initializer=_initialise_worker,
+            initargs=(fitness_func,),
+        )
+
+    def map(self, chromosomes: list) -> list:
+        if not chromosomes:
+            return []
+        # a few chunks per worker keeps the pool busy when costs are uneven
+        chunksize = self.chunksize or math.ceil(len(chromosomes) / (4 * self.max_workers))
+        chunks = [chromosomes[i: i + chunksize] for i in range(0, len(chromosomes), chunksize)]
+        return [fitness for chunk in self.executor.map(_evaluate_chunk, chunks) for fitness in chunk]
+
+    def submit(self, chromosome: list) -> Future:
+        return self.executor.submit(_evaluate_one, chromosome)
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["executor"] = None
+        return state
@@ -0,0 +1,43 @@
+import itertools
+from array import array
+
+
+def gene_typecode(gene_space: list) -> str:
+    # int genes share float storage when the gene space is mixed
+    return "q" if all(gene_type == int for gene_type, _, _ in gene_space) else "d"
+
+
+class Individual:
+    """
+    One member of the population: an integer id, typed gene storage
+    (array('q') or array('d')) and a fitness that is None until scored.
+    Unpacks and indexes as (id, genes, fitness) like the tuples it replaces.
+    """
+    __slots__ = ("id", "genes", "fitness")
+
+    _ids = itertools.count()
+
+    def __init__(self, genes: array, fitness: float = None, id: int = None):
+        self.id = next(Individual._ids) if id is None else id
+        self.genes = genes
+        self.fitness = fitness
+
+    @classmethod
+    def peek_id(cls) -> int:
+        id = next(cls._ids)
+        cls._ids = itertools.count(id)
+        return id
+
+    @classmethod
+    def advance_ids(cls, id: int) -> None:
+        # never hand out an id below one already in use
+        cls._ids = itertools.count(max(id, cls.peek_id()))
+
+    def __iter__(self):
+        return iter((self.id, self.genes, self.fitness))
+
+    def __getitem__(self, index):
+        return (self.id, self.genes, self.fitness)[index]
+
+    def __repr__(self):
+        return f"Individual({self.id}, {self.genes.tolist() if isinstance(self.genes, array) else self.genes}, {self.fitness})"
@@ -0,0 +1,132 @@
+import logging
+import multiprocessing
+import time
+from enum import Enum, auto
+from multiprocessing.connection import wait
+
+logger = logging.getLogger(__name__)
+
+
+class MigrationTopology(Enum):
+    RING = auto()
+    FULLY_CONNECTED = auto()
+
+
+def _island_worker(connection, algorithm_class, seed, generations: int, migration_interval: int, migrants: int):
+    ga = algorithm_class()
+    ga.reseed(seed)
+    ga.evaluator.start(ga.fitness_func)
+    try:
+        ga._timed("initialisation", ga._initialise_population)
+        history = []
+        for generation in range(generations):
+            ga.evolve()
+
+            history.append([generation, ga.best_individual().fitness])
+
+            if (generation + 1) % migration_interval == 0 and generation + 1 < generations:
+                # only the best gene vectors travel, never the population itself
+                connection.send(ga.emigrants(migrants))
+                ga.immigrate(connection.recv())
+
+        best = ga.best_individual()
+        connection.send((ga.decode(best.genes), best.fitness, history))
+    finally:
+        ga.evaluator.shutdown()
+        connection.close()
+
+
+def _receive_all(connections: list, processes: list) -> list:
+    # one message from every island; an island that exits without sending is
+    # seen through its process sentinel rather than waited on forever
+    messages = [None] * len(connections)
+    pending = set(range(len(connections)))
+    while pending:
+        ready = set(wait([connections[i] for i in pending] + [processes[i].sentinel for i in pending]))
+        for i in list(pending):
+            if connections[i] not in ready and processes[i].sentinel not in ready:
+                continue
+            try:
+                if not connections[i].poll():
+                    raise EOFError
+                messages[i] = connections[i].recv()
+            except EOFError:
+                processes[i].join()
+                raise RuntimeError(f"Island {i} exited with code {processes[i].exitcode}") from None
+            pending.discard(i)
+    return messages
+
+
+class IslandModel:
+    """
+    Evolves one sub-population per GeneticAlgorithm subclass in its own
+    process. Every migration_interval generations each island sends copies
+    of its best `migrants` chromosomes to its neighbours in the topology,
+    where they replace the weakest individuals.
+    """
+
+    def __init__(
+            self,
+            islands: list,
+            generations: int = None,
+            migration_interval: int = 10,
+            migrants: int = 2,
+            topology: MigrationTopology = MigrationTopology.RING,
+            seed: int = None,
+            mp_context=None,
+    ):
+        self.islands = islands
+        self.generations = generations or islands[0].generations
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.topology = topology
+        self.seed = seed
+        self.mp_context = mp_context or multiprocessing.get_context()
+
+    def sources(self, island: int) -> list:
+        if self.topology == MigrationTopology.RING:
+            return [(island - 1) % len(self.islands)]
+        return [other for other in range(len(self.islands)) if other != island]
+
+    def run(self) -> tuple:
+        """
+        Returns the global best (chromosome, fitness) and the
+        [generation, best_fitness] history of every island.
+        """
+        start = time.time()
+        connections, processes = [], []
+        for i, algorithm_class in enumerate(self.islands):
+            connection, worker_connection = self.mp_context.Pipe()
+            seed = None if self.seed is None else self.seed + i
+            process = self.mp_context.Process(
+                target=_island_worker,
+                args=(worker_connection, algorithm_class, seed, self.generations, self.migration_interval, self.migrants),
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+            connections.append(connection)
+            processes.append(process)
+
+        try:
+            for _ in range((self.generations - 1) // self.migration_interval):
+                payloads = _receive_all(connections, processes)
+                for i, connection in enumerate(connections):
+                    connection.send([chromosome for j in self.sources(i) for chromosome in payloads[j]])
+
+            results = _receive_all(connections, processes)
+        except BaseException:
+            # the other islands would wait for their migrants forever
+            for connection in connections:
+                connection.close()
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            raise
+        finally:
+            for process in processes:
+                process.join()
+
+        chromosome, fitness, _ = max(results, key=lambda result: result[1])
+        logger.info("Took %d seconds across %d islands", time.time() - start, len(self.islands))
+        return (chromosome, fitness), [history for _, _, history in results]
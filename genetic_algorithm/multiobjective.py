@@ -0,0 +1,183 @@
+"""
+NSGA-II on the vectorized engine. fitness_func (or batch_fitness_func)
+returns one value per objective, all maximised, and the population is
+ranked by non-dominated sorting with crowding distance breaking ties.
+
+    class Placement(MultiObjectiveGeneticAlgorithm, PlacementGeneticAlgorithm):
+        objective_weights = (3, 0.5, 1)
+
+        def fitness_func(self, chromosome):
+            return coverage, quality, efficiency
+
+    ga.run()
+    ga.pareto_front()  # [(chromosome, objectives), ...]
+"""
+import logging
+
+import numpy as np
+
+from genetic_algorithm import ReplacementMethod
+from genetic_algorithm.capacity import crowding_distance
+from genetic_algorithm.individual import Individual
+from genetic_algorithm.vectorized import VectorizedGeneticAlgorithm
+
+logger = logging.getLogger(__name__)
+
+
+def dominance_matrix(objectives: np.ndarray) -> np.ndarray:
+    """[i, j] is True when row i dominates row j: no worse anywhere, better somewhere."""
+    columns = objectives.T[:, :, None]
+    no_worse = np.ones((len(objectives), len(objectives)), dtype=bool)
+    better = np.zeros_like(no_worse)
+    # one (n x n) comparison per objective rather than an (n x n x m) block
+    for column in columns:
+        no_worse &= column >= column.T
+        better |= column > column.T
+    return no_worse & better
+
+
+def non_dominated_sort(objectives: np.ndarray) -> np.ndarray:
+    """Front of each row, 0 for the Pareto front."""
+    objectives = np.asarray(objectives, dtype=float)
+    dominates = dominance_matrix(objectives)
+    dominated_by = dominates.sum(axis=0)
+    rank = np.full(len(objectives), -1)
+    front = np.flatnonzero(dominated_by == 0)
+    level = 0
+    while len(front):
+        rank[front] = level
+        dominated_by[front] = -1
+        dominated_by -= dominates[front].sum(axis=0)
+        front = np.flatnonzero(dominated_by == 0)
+        level += 1
+    return rank
+
+
+def crowded_order(objectives: np.ndarray) -> tuple:
+    """
+    Front rank and crowding distance of each row, and the indices of all
+    rows best first: lowest front, then the least crowded.
+    """
+    rank = non_dominated_sort(objectives)
+    crowding = np.empty(len(objectives))
+    for level in range(rank.max() + 1 if len(rank) else 0):
+        members = np.flatnonzero(rank == level)
+        crowding[members] = crowding_distance(objectives[members])
+    return rank, crowding, np.lexsort((-crowding, rank))
+
+
+class MultiObjectiveGeneticAlgorithm(VectorizedGeneticAlgorithm):
+    """
+    fitness is an (individuals x objectives) array. Selection runs on the
+    crowded order (binary tournaments by default) and replacement keeps the
+    best population_size of parents and children in that order.
+
+    objective_weights only gives the run a scalar view for logging,
+    telemetry and stopping criteria; it does not steer the search.
+    """
+    tournament_size = 2
+    replacement_method = ReplacementMethod.WEAK_INDIVIDUALS
+    objective_weights = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.surrogate:
+            raise ValueError("Surrogate screening needs a single fitness value per chromosome")
+        self.rank = np.empty(0, dtype=int)
+        self.crowding = np.empty(0)
+        self.crowded_fitness = np.empty(0)
+
+    def _rank(self) -> None:
+        self.rank, self.crowding, order = crowded_order(self.fitness)
+        # a scalar stand-in for the selection methods: higher is better
+        self.crowded_fitness = np.empty(len(order))
+        self.crowded_fitness[order] = np.arange(len(order), 0, -1)
+
+    def _score(self, matrix: np.ndarray, parents: np.ndarray = None) -> np.ndarray:
+        fitness = np.asarray(super()._score(matrix, parents), dtype=float)
+        return fitness.reshape(len(matrix), -1)
+
+    def _initialise_population(self):
+        super()._initialise_population()
+        self._rank()
+
+    def perform_selection(self) -> np.ndarray:
+        return self.selection_method(self.crowded_fitness, self.num_of_parents)
+
+    def perform_replacement(self, parents: np.ndarray, children: np.ndarray, fitness: np.ndarray) -> None:
+        if self.replacement_method != ReplacementMethod.WEAK_INDIVIDUALS:
+            raise ValueError("MultiObjectiveGeneticAlgorithm only supports ReplacementMethod.WEAK_INDIVIDUALS")
+        genes = np.concatenate([self.genes, children])
+        fitness = np.concatenate([self.fitness, fitness])
+        # copies of a chromosome never dominate each other, left in they crowd out the front
+        _, unique = np.unique(genes, axis=0, return_index=True)
+        copies = np.setdiff1d(np.arange(len(genes)), unique)
+        _, _, order = crowded_order(fitness[unique])
+        keep = np.concatenate([unique[order], copies])[:self.population_size]
+        self.genes, self.fitness = genes[keep], fitness[keep]
+        self._rank()
+
+    def _enforce_capacity(self) -> None:
+        # evicted in reverse crowded order whatever the eviction_method: the
+        # worst front first, the most crowded rows of a front before the rest
+        capacity = self.population_capacity()
+        if capacity is None or len(self.fitness) <= capacity:
+            return
+        _, _, order = crowded_order(self.fitness)
+        keep = np.sort(order[:capacity])
+        self.genes, self.fitness = self.genes[keep], self.fitness[keep]
+        self._rank()
+
+    def scalar_fitness(self) -> np.ndarray:
+        weights = np.ones(self.fitness.shape[1]) if self.objective_weights is None else self.objective_weights
+        return self.fitness @ np.asarray(weights, dtype=float)
+
+    def pareto_front(self) -> list:
+        front = np.flatnonzero(self.rank == 0)
+        _, unique = np.unique(self.genes[front], axis=0, return_index=True)
+        front = front[unique]
+        front = front[np.lexsort(self.fitness[front].T[::-1])]
+        return [(self.to_chromosome(self.genes[i]), tuple(self.fitness[i].tolist())) for i in front]
+
+    def fitness_summary(self) -> tuple:
+        scalar = self.scalar_fitness()
+        return float(scalar.max()), float(scalar.min()), float(scalar.mean()), float(scalar.std())
+
+    def generation_record(self, generation: int, seconds: float) -> dict:
+        record = super().generation_record(generation, seconds)
+        record["front"] = int((self.rank == 0).sum())
+        return record
+
+    def best_individual(self) -> Individual:
+        # best under objective_weights, with its objectives as the fitness
+        best = int(np.argmax(self.scalar_fitness()))
+        return Individual(self.to_chromosome(self.genes[best]), tuple(self.fitness[best].tolist()), id=best)
+
+    def best_fitness(self) -> float:
+        return float(self.scalar_fitness().max())
+
+    def emigrants(self, k: int) -> np.ndarray:
+        return self.genes[np.argsort(-self.crowded_fitness)[:k]].copy()
+
+    def immigrate(self, chromosomes) -> None:
+        chromosomes = np.asarray(chromosomes, dtype=float)[:len(self.fitness)]
+        if not len(chromosomes):
+            return
+        weakest = np.argsort(self.crowded_fitness)[:len(chromosomes)]
+        self.genes[weakest] = chromosomes
+        self.fitness[weakest] = self._score(chromosomes)
+        self._rank()
+
+    def _restore_population(self, state: dict) -> None:
+        super()._restore_population(state)
+        self._rank()
+
+    def sort_population(self) -> None:
+        order = np.argsort(-self.crowded_fitness)
+        self.genes, self.fitness = self.genes[order], self.fitness[order]
+        self._rank()
+
+    def _log_summary(self):
+        logger.info("Individuals %d, Pareto front %d", len(self.genes), int((self.rank == 0).sum()))
+        for chromosome, objectives in self.pareto_front()[:10]:
+            logger.info("Pareto front %s %s", chromosome, objectives)
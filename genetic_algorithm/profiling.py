@@ -0,0 +1,90 @@
+"""
+Run profiling. Phase and fitness timers are always on (two perf_counter
+calls per phase or fitness batch); Profiler adds totals over the whole run
+and, opt-in, cProfile and tracemalloc reports.
+
+    ga.reporters = [Profiler("profile.txt", cprofile=True, memory=True)]
+    ga.run()
+"""
+import io
+import logging
+import time
+from collections import defaultdict
+
+from genetic_algorithm.reporting import Reporter
+
+logger = logging.getLogger(__name__)
+
+
+class Profiler(Reporter):
+    def __init__(self, path: str = None, cprofile: bool = False, memory: bool = False, top: int = 25):
+        self.path = path
+        self.cprofile = cprofile
+        self.memory = memory
+        self.top = top
+        self.phase_seconds = defaultdict(float)
+        self.run_seconds = None
+        self.peak_memory = None
+        self._profile = None
+        self._snapshot = None
+        self._start = None
+
+    def start(self, ga) -> None:
+        self.phase_seconds.clear()
+        self._start = time.perf_counter()
+        if self.memory:
+            import tracemalloc
+
+            tracemalloc.start()
+        if self.cprofile:
+            import cProfile
+
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def generation(self, ga, record: dict) -> None:
+        for phase, seconds in ga.phase_seconds.items():
+            self.phase_seconds[phase] += seconds
+
+    def end(self, ga, fitness_graph: list) -> None:
+        if self._profile is not None:
+            self._profile.disable()
+        self.run_seconds = time.perf_counter() - self._start
+        if self.memory:
+            import tracemalloc
+
+            self._snapshot = tracemalloc.take_snapshot()
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        report = self.report(ga)
+        if self.path is None:
+            logger.info("Profile:\n%s", report)
+        else:
+            with open(self.path, "w") as f:
+                f.write(report)
+            logger.info("Profile written to %s", self.path)
+        self._profile = self._snapshot = None
+
+    def report(self, ga) -> str:
+        lines = [f"Run: {self.run_seconds:.3f} seconds, {ga.evaluations} fitness calls", "", "Phases:"]
+        for phase, seconds in sorted(self.phase_seconds.items(), key=lambda item: -item[1]):
+            lines.append(f"  {phase:<16}{seconds:>12.4f} s{100 * seconds / self.run_seconds:>8.1f} %")
+
+        lines += ["", "Fitness calls by call site:"]
+        for site, calls in sorted(ga.fitness_calls.items()):
+            seconds = ga.fitness_seconds[site]
+            lines.append(f"  {site:<16}{calls:>10} calls{seconds:>12.4f} s{1e6 * seconds / calls:>12.2f} us/call")
+
+        if self._profile is not None:
+            import pstats
+
+            stream = io.StringIO()
+            pstats.Stats(self._profile, stream=stream).sort_stats("cumulative").print_stats(self.top)
+            lines += ["", "cProfile:", stream.getvalue()]
+
+        if self._snapshot is not None:
+            lines += ["", f"tracemalloc: peak {self.peak_memory} bytes, top allocations:"]
+            lines += [f"  {stat}" for stat in self._snapshot.statistics("lineno")[:self.top]]
+
+        return "\n".join(lines) + "\n"
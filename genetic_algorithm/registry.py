@@ -0,0 +1,34 @@
+"""
+Name -> class registries behind the operator and model specs. A spec is a
+registered name or a class, both instantiated with their defaults, or an
+instance, used as is.
+
+    CROSSOVER_OPERATORS = Registry("crossover operator")
+
+    @CROSSOVER_OPERATORS.register("sbx")
+    class SimulatedBinaryCrossover: ...
+
+    CROSSOVER_OPERATORS.resolve("sbx")
+"""
+
+
+class Registry(dict):
+    def __init__(self, kind: str):
+        super().__init__()
+        self.kind = kind
+
+    def register(self, name: str):
+        def register(registered_class):
+            self[name] = registered_class
+            return registered_class
+
+        return register
+
+    def resolve(self, spec):
+        if isinstance(spec, str):
+            if spec not in self:
+                raise ValueError(f"Unknown {self.kind} {spec!r}, expected one of {sorted(self)}")
+            return self[spec]()
+        if isinstance(spec, type):
+            return spec()
+        return spec
@@ -0,0 +1,65 @@
+import logging
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    logging.basicConfig(level=level)
+
+
+class Reporter:
+    """
+    Opt-in hooks around GeneticAlgorithm.run. Heavy dependencies are
+    imported by the reporters themselves, on first use.
+    """
+
+    def start(self, ga) -> None:
+        pass
+
+    def generation(self, ga, record: dict) -> None:
+        # record is GeneticAlgorithm.generation_record(): fitness summary,
+        # evaluation and cache counters and seconds per phase
+        pass
+
+    def end(self, ga, fitness_graph: list) -> None:
+        pass
+
+
+class ProgressBar(Reporter):
+    def __init__(self, desc: str = "Basic", unit: str = "ticks"):
+        self.desc = desc
+        self.unit = unit
+        self.pbar = None
+
+    def start(self, ga) -> None:
+        import enlighten
+
+        self.pbar = enlighten.Counter(total=ga.generations, desc=self.desc, unit=self.unit)
+
+    def generation(self, ga, record: dict) -> None:
+        self.pbar.update()
+
+    def end(self, ga, fitness_graph: list) -> None:
+        self.pbar.close()
+
+
+class FitnessGraph(Reporter):
+    def __init__(self, path: str = "fitness-graph.png"):
+        self.path = path
+
+    def end(self, ga, fitness_graph: list) -> None:
+        plot_fitness_graph(fitness_graph, self.path)
+
+
+def plot_fitness_graph(fitness_graph: list, path: str = "fitness-graph.png") -> None:
+    import matplotlib.pyplot as plt
+
+    x_values = [row[0] for row in fitness_graph]
+    y_values = [row[1] for row in fitness_graph]
+
+    plt.plot(x_values, y_values)
+    plt.xlabel("Generation")
+    plt.ylabel("Fitness Value")
+
+    plt.title("Fitness Graph")
+    # plt.suptitle("f")
+
+    plt.savefig(path)
@@ -0,0 +1,60 @@
+"""
+Selection kernels over a fitness vector. They return indices into it, so
+the list engine and the vectorized engine share them.
+"""
+import numpy as np
+
+# contender matrices are built in chunks of at most this many entries, small
+# enough that each chunk and its temporaries stay in cache
+CHUNK_SIZE = 1 << 14
+
+
+def tournament(fitness: np.ndarray, tournaments: int, size: int, rng: np.random.Generator, winners: int = 1):
+    """
+    Runs independent tournaments of `size` contenders drawn with replacement
+    and returns the best `winners` of each, best first, as a
+    (tournaments x winners) index array.
+    """
+    size = max(size, winners)
+    result = np.empty((tournaments, winners), dtype=np.intp)
+    step = max(1, CHUNK_SIZE // size)
+    for start in range(0, tournaments, step):
+        rows = min(step, tournaments - start)
+        contenders = rng.integers(0, len(fitness), size=(rows, size))
+        scores = fitness[contenders]
+        if winners == 1:
+            best = np.argmax(scores, axis=1)[:, None]
+        else:
+            best = np.argpartition(scores, size - winners, axis=1)[:, size - winners:]
+            order = np.argsort(-np.take_along_axis(scores, best, axis=1), axis=1, kind="stable")
+            best = np.take_along_axis(best, order, axis=1)
+        result[start:start + rows] = np.take_along_axis(contenders, best, axis=1)
+    return result
+
+
+def _wheel(weights: np.ndarray) -> np.ndarray:
+    # shifted so the weakest has no share, uniform when every weight is equal
+    weights = weights - weights.min()
+    if not weights.any():
+        weights = np.ones_like(weights)
+    return np.cumsum(weights)
+
+
+def roulette_wheel(fitness: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    wheel = _wheel(fitness)
+    return np.searchsorted(wheel, rng.random(count) * wheel[-1], side="right")
+
+
+def stochastic_universal_sampling(fitness: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    # one spin, `count` evenly spaced pointers; shuffled so neighbours are not paired together
+    wheel = _wheel(fitness)
+    pointers = (rng.random() + np.arange(count)) * (wheel[-1] / count)
+    return rng.permutation(np.searchsorted(wheel, pointers, side="right"))
+
+
+def rank(fitness: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    # linear ranking: the weakest has weight 1, the fittest n
+    ranks = np.empty(len(fitness))
+    ranks[np.argsort(fitness, kind="stable")] = np.arange(1, len(fitness) + 1)
+    wheel = np.cumsum(ranks)
+    return np.searchsorted(wheel, rng.random(count) * wheel[-1], side="right")
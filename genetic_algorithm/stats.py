@@ -0,0 +1,90 @@
+import bisect
+import math
+
+import numpy as np
+
+
+class PopulationStats:
+    """
+    Fitness statistics kept up to date as individuals enter and leave the
+    population. Individuals are ranked in a sorted list of (fitness, id), so
+    best, worst and mean/variance (Welford) read in O(1) and the top-k elite
+    in O(k); an update costs a binary search plus a list insert or delete.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        self._ranked = []
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, id: int, fitness: float) -> None:
+        bisect.insort(self._ranked, (fitness, id))
+        self.count += 1
+        delta = fitness - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (fitness - self.mean)
+
+    def remove(self, id: int, fitness: float) -> None:
+        del self._ranked[bisect.bisect_left(self._ranked, (fitness, id))]
+        self.count -= 1
+        if not self.count:
+            self.mean = self._m2 = 0.0
+            return
+        delta = fitness - self.mean
+        self.mean -= delta / self.count
+        self._m2 = max(self._m2 - delta * (fitness - self.mean), 0.0)
+
+    @property
+    def best(self) -> float:
+        return self._ranked[-1][0] if self._ranked else None
+
+    @property
+    def best_id(self) -> int:
+        return self._ranked[-1][1] if self._ranked else None
+
+    @property
+    def worst(self) -> float:
+        return self._ranked[0][0] if self._ranked else None
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def elite(self, k: int) -> list:
+        """Ids of the k fittest individuals, best first."""
+        return [id for _, id in self._ranked[:-k - 1:-1]] if k > 0 else []
+
+    def weakest(self, k: int) -> list:
+        """Ids of the k least fit individuals, worst first."""
+        return [id for _, id in self._ranked[:k]]
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "best": self.best,
+            "worst": self.worst,
+            "mean": self.mean,
+            "variance": self.variance,
+        }
+
+
+def gene_diversity(genes: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> float:
+    """
+    Mean standard deviation of each gene across the (individuals x genes)
+    array, as a fraction of its range: 0 once every individual is identical.
+    """
+    if len(genes) < 2:
+        return 0.0
+    span = upper - lower
+    varying = span > 0
+    if not varying.any():
+        return 0.0
+    return float(np.mean(np.std(genes[:, varying], axis=0) / span[varying]))
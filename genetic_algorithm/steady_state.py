@@ -0,0 +1,131 @@
+"""
+Steady-state evolution without generation barriers. Up to `concurrency`
+children are being scored at any time; as soon as one is scored it enters
+the population through the configured ReplacementMethod and another child
+is bred to take its place.
+
+Children are scored by the evaluator's executor (ThreadPoolEvaluator,
+ProcessPoolEvaluator), or awaited directly when fitness_func is an
+`async def`. A "generation" is num_of_parents children inserted, so
+reporters, stopping criteria and checkpoints work as in the generational
+engine; children still in flight simply carry over to the next one.
+"""
+import asyncio
+import inspect
+import os
+import time
+
+from genetic_algorithm import GeneticAlgorithm
+from genetic_algorithm.cache import MISSING
+
+
+class SteadyStateGeneticAlgorithm(GeneticAlgorithm):
+    # children in flight at once, None for one per evaluator worker
+    concurrency = None
+    _transient_state = GeneticAlgorithm._transient_state + ("_loop", "_in_flight")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.surrogate:
+            raise ValueError("SteadyStateGeneticAlgorithm does not support surrogate screening")
+        self._loop = None
+        self._in_flight = set()
+
+    @property
+    def async_fitness(self) -> bool:
+        return inspect.iscoroutinefunction(self.fitness_func)
+
+    def run(self):
+        if not self.async_fitness:
+            self.evaluator.start(self.fitness_func)
+        loop = self._event_loop()
+        try:
+            self._run()
+        finally:
+            loop.run_until_complete(self._cancel_in_flight())
+            loop.close()
+            self._loop = None
+            self.evaluator.shutdown()
+
+    async def _cancel_in_flight(self) -> None:
+        # children still in flight when the run ends are dropped
+        for task in self._in_flight:
+            task.cancel()
+        await asyncio.gather(*self._in_flight, return_exceptions=True)
+        self._in_flight.clear()
+
+    def _evaluate_batch(self, chromosomes: list) -> list:
+        if not self.async_fitness:
+            return super()._evaluate_batch(chromosomes)
+        return self._event_loop().run_until_complete(self._gather(chromosomes))
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        # outside run(), e.g. ga.evaluate() on its own
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    async def _gather(self, chromosomes: list) -> list:
+        limit = asyncio.Semaphore(self._concurrency())
+
+        async def score(chromosome):
+            async with limit:
+                return await self.fitness_func(chromosome)
+
+        return await asyncio.gather(*(score(chromosome) for chromosome in chromosomes))
+
+    def _concurrency(self) -> int:
+        return self.concurrency or getattr(self.evaluator, "max_workers", None) or os.cpu_count() or 1
+
+    def evolve(self) -> None:
+        self._event_loop().run_until_complete(self._insert(self.num_of_parents))
+        self._timed("capacity", self._enforce_capacity)
+        self._timed("reevaluation", self._calculate_fitness)
+
+    async def _insert(self, count: int) -> None:
+        inserted = 0
+        while inserted < count:
+            free = self._concurrency() - len(self._in_flight)
+            if free > 0:
+                inserted += self._dispatch(free)
+
+            if self._in_flight and inserted < count:
+                start = time.perf_counter()
+                done, self._in_flight = await asyncio.wait(self._in_flight, return_when=asyncio.FIRST_COMPLETED)
+                self.phase_seconds["evaluation"] += time.perf_counter() - start
+                for task in done:
+                    parent, child, fitness, seconds = task.result()
+                    self.fitness_cache.put(tuple(child.genes), fitness)
+                    self._record_fitness_calls(1, seconds, "evaluation")
+                    child.fitness = fitness
+                    self._timed("replacement", self.perform_replacement, [parent], [child])
+                    inserted += 1
+
+    def _dispatch(self, count: int) -> int:
+        """
+        Breeds `count` children (rounded up to even) and sends them off to be
+        scored; returns how many were inserted at once from the fitness cache.
+        """
+        parents = self._timed("selection", self.selection_method, self.population, count)
+        children = self._timed("crossover", self.perform_crossover, parents)
+        children = self._timed("mutation", self.perform_mutation, children)
+
+        inserted = 0
+        for parent, child in zip(parents, children):
+            fitness = self.fitness_cache.get(tuple(child.genes))
+            if fitness is MISSING:
+                self._in_flight.add(self._loop.create_task(self._score(parent, child)))
+                continue
+            child.fitness = fitness
+            self._timed("replacement", self.perform_replacement, [parent], [child])
+            inserted += 1
+        return inserted
+
+    async def _score(self, parent, child) -> tuple:
+        chromosome = self.decode(child.genes)
+        start = time.perf_counter()
+        if self.async_fitness:
+            fitness = await self.fitness_func(chromosome)
+        else:
+            fitness = await asyncio.wrap_future(self.evaluator.submit(chromosome))
+        return parent, child, fitness, time.perf_counter() - start
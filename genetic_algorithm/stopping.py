@@ -0,0 +1,107 @@
+"""
+Criteria that end a run before `generations` is reached. They are checked
+after every generation and the first one met ends the run:
+
+    stopping_criteria = [Stagnation(50), WallClock(15 * 60)]
+
+ga.stop_reason then names the criterion, or the generation limit.
+"""
+import time
+from abc import abstractmethod, ABC
+
+
+class StoppingCriterion(ABC):
+    def start(self, ga) -> None:
+        pass
+
+    def state(self) -> dict:
+        # JSON-serialisable progress a checkpoint carries across a resume, in place of start()
+        return {}
+
+    def restore(self, state: dict) -> None:
+        pass
+
+    @abstractmethod
+    def should_stop(self, ga) -> bool:
+        pass
+
+    def __repr__(self):
+        arguments = ", ".join(f"{name}={value!r}" for name, value in vars(self).items() if not name.startswith("_"))
+        return f"{type(self).__name__}({arguments})"
+
+
+class Stagnation(StoppingCriterion):
+    """The best fitness has not improved by more than `tolerance` for `generations` generations."""
+
+    def __init__(self, generations: int, tolerance: float = 0.0):
+        self.generations = generations
+        self.tolerance = tolerance
+        self._best = None
+        self._since = 0
+
+    def start(self, ga) -> None:
+        self._best = None
+        self._since = 0
+
+    def state(self) -> dict:
+        return {"best": self._best, "since": self._since}
+
+    def restore(self, state: dict) -> None:
+        self._best = state["best"]
+        self._since = state["since"]
+
+    def should_stop(self, ga) -> bool:
+        best = ga.best_fitness()
+        if self._best is None or best > self._best + self.tolerance:
+            self._best = best
+            self._since = 0
+        else:
+            self._since += 1
+        return self._since >= self.generations
+
+
+class TargetFitness(StoppingCriterion):
+    def __init__(self, target: float):
+        self.target = target
+
+    def should_stop(self, ga) -> bool:
+        return ga.best_fitness() >= self.target
+
+
+class WallClock(StoppingCriterion):
+    """`seconds` of wall-clock time have passed since the run started."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self._deadline = None
+
+    def start(self, ga) -> None:
+        self._deadline = time.monotonic() + self.seconds
+
+    def state(self) -> dict:
+        # a resumed run gets what was left of the budget
+        return {"elapsed": time.monotonic() - self._deadline + self.seconds}
+
+    def restore(self, state: dict) -> None:
+        self._deadline = time.monotonic() + self.seconds - state["elapsed"]
+
+    def should_stop(self, ga) -> bool:
+        return time.monotonic() >= self._deadline
+
+
+class MaxEvaluations(StoppingCriterion):
+    def __init__(self, evaluations: int):
+        self.evaluations = evaluations
+
+    def should_stop(self, ga) -> bool:
+        return ga.evaluations >= self.evaluations
+
+
+class DiversityFloor(StoppingCriterion):
+    """The population has converged: GeneticAlgorithm.diversity() fell below `minimum`."""
+
+    def __init__(self, minimum: float):
+        self.minimum = minimum
+
+    def should_stop(self, ga) -> bool:
+        return ga.diversity() < self.minimum
@@ -0,0 +1,211 @@
+"""
+Surrogate pre-screening of children. A cheap model, trained online on
+every chromosome the fitness function has scored, predicts the fitness of
+each new child; only the most promising fraction is evaluated for real
+and the rest are dropped before replacement.
+
+    surrogate = SurrogateScreen("knn", fraction=0.25)
+    surrogate = SurrogateScreen(RBFSurrogate(maxsize=300), fraction=0.5, warmup=200)
+
+Models see genes scaled to [0, 1] by the gene space bounds. Screening is
+for single-objective fitness; it starts once the archive holds `warmup`
+chromosomes. Children whose fitness is already cached are kept without
+being screened. `saved` counts the evaluations skipped and
+`rank_correlation` is the Spearman correlation between predicted and true
+fitness over the last `window` evaluated children. A random `audit` share
+of the rejected children is evaluated anyway, so that correlation covers
+the whole range of predictions and not just the top of it. Checkpoints
+carry the archive and the counters, so a resumed run screens exactly as
+the uninterrupted one would have.
+"""
+import math
+from abc import abstractmethod, ABC
+
+import numpy as np
+
+from genetic_algorithm.registry import Registry
+
+SURROGATE_MODELS = Registry("surrogate model")
+register_surrogate_model = SURROGATE_MODELS.register
+
+
+def _ranks(values) -> np.ndarray:
+    # ties share their average rank
+    _, inverse, counts = np.unique(np.asarray(values, dtype=float), return_inverse=True, return_counts=True)
+    return (np.cumsum(counts) - (counts + 1) / 2)[inverse]
+
+
+def rank_correlation(a, b) -> float:
+    """Spearman's rho, nan when either side is constant."""
+    a, b = _ranks(a), _ranks(b)
+    a -= a.mean()
+    b -= b.mean()
+    scale = math.sqrt((a @ a) * (b @ b))
+    return float(a @ b / scale) if scale else math.nan
+
+
+class SurrogateModel(ABC):
+    """The `maxsize` most recently scored chromosomes and their fitness."""
+
+    def __init__(self, maxsize: int = 2000):
+        self.maxsize = maxsize
+        self.genes = None
+        self.fitness = np.empty(0)
+
+    def __len__(self) -> int:
+        return len(self.fitness)
+
+    def add(self, genes: np.ndarray, fitness: np.ndarray) -> None:
+        if self.genes is None:
+            self.genes = np.empty((0, genes.shape[1]))
+        self.genes = np.concatenate([self.genes, genes])[-self.maxsize:]
+        self.fitness = np.concatenate([self.fitness, fitness])[-self.maxsize:]
+
+    @abstractmethod
+    def predict(self, genes: np.ndarray) -> np.ndarray:
+        pass
+
+
+def _squared_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.maximum((a * a).sum(axis=1)[:, None] - 2 * a @ b.T + (b * b).sum(axis=1)[None, :], 0.0)
+
+
+@register_surrogate_model("knn")
+class KNNSurrogate(SurrogateModel):
+    """Inverse-distance weighted mean fitness of the k nearest archived chromosomes."""
+
+    def __init__(self, k: int = 5, maxsize: int = 2000):
+        super().__init__(maxsize)
+        self.k = k
+
+    def predict(self, genes: np.ndarray) -> np.ndarray:
+        k = min(self.k, len(self))
+        distances = np.sqrt(_squared_distances(genes, self.genes))
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        distances = np.take_along_axis(distances, nearest, axis=1)
+        weights = 1.0 / (distances + 1e-9)
+        return (weights * self.fitness[nearest]).sum(axis=1) / weights.sum(axis=1)
+
+
+@register_surrogate_model("rbf")
+class RBFSurrogate(SurrogateModel):
+    """
+    Gaussian radial basis function interpolation of the archive. The width
+    defaults to twice the median distance between archived chromosomes
+    and their nearest neighbours; the model is refitted, one dense solve,
+    whenever the archive changed.
+    """
+
+    def __init__(self, epsilon: float = None, smoothing: float = 1e-6, maxsize: int = 500):
+        super().__init__(maxsize)
+        self.epsilon = epsilon
+        self.smoothing = smoothing
+        self._weights = None
+
+    def add(self, genes: np.ndarray, fitness: np.ndarray) -> None:
+        super().add(genes, fitness)
+        self._weights = None
+
+    def _fit(self) -> None:
+        distances = _squared_distances(self.genes, self.genes)
+        if self.epsilon is None:
+            nearest = np.sqrt(np.where(np.eye(len(self), dtype=bool), np.inf, distances).min(axis=1))
+            self._width = 2 * float(np.median(nearest[np.isfinite(nearest)])) or 1.0
+        else:
+            self._width = self.epsilon
+        self._offset = float(self.fitness.mean())
+        kernel = np.exp(-distances / self._width ** 2) + self.smoothing * np.eye(len(self))
+        try:
+            self._weights = np.linalg.solve(kernel, self.fitness - self._offset)
+        except np.linalg.LinAlgError:
+            # duplicate chromosomes with too little smoothing
+            self._weights = np.linalg.lstsq(kernel, self.fitness - self._offset, rcond=None)[0]
+
+    def predict(self, genes: np.ndarray) -> np.ndarray:
+        if self._weights is None:
+            self._fit()
+        return self._offset + np.exp(-_squared_distances(genes, self.genes) / self._width ** 2) @ self._weights
+
+
+def surrogate_model(spec):
+    return SURROGATE_MODELS.resolve(spec)
+
+
+class SurrogateScreen:
+    def __init__(self, model="knn", fraction: float = 0.25, warmup: int = 100, audit: float = 0.05,
+                 window: int = 500):
+        self.model = surrogate_model(model)
+        self.fraction = fraction
+        self.warmup = warmup
+        self.audit = audit
+        self.window = window
+        # children offered that needed a true evaluation, and those dropped without one
+        self.candidates = 0
+        self.saved = 0
+        self.rank_correlation = math.nan
+        self._predicted = None
+        self._pairs = np.empty((0, 2))
+
+    def start(self, lower: np.ndarray, upper: np.ndarray) -> None:
+        self._lower = lower
+        self._span = np.where(upper > lower, upper - lower, 1.0)
+
+    def _scale(self, genes) -> np.ndarray:
+        return (np.asarray(genes, dtype=float) - self._lower) / self._span
+
+    def state(self) -> dict:
+        # NumPy arrays for a checkpoint: the model's archive, the validation window and the counters
+        return {
+            "archive_genes": np.empty((0, len(self._lower))) if self.model.genes is None else self.model.genes,
+            "archive_fitness": self.model.fitness,
+            "pairs": self._pairs,
+            "counters": np.array([self.candidates, self.saved, self.rank_correlation]),
+        }
+
+    def restore(self, state: dict) -> None:
+        self.model.genes = None
+        self.model.fitness = np.empty(0)
+        self.model.add(state["archive_genes"], state["archive_fitness"])
+        self._pairs = state["pairs"]
+        candidates, saved, self.rank_correlation = state["counters"].tolist()
+        self.candidates, self.saved = int(candidates), int(saved)
+
+    def observe(self, genes, fitness) -> None:
+        """Adds truly evaluated chromosomes to the model's archive."""
+        if len(fitness):
+            self.model.add(self._scale(genes), np.asarray(fitness, dtype=float))
+
+    def screen(self, genes: np.ndarray, rng: np.random.Generator, known=None) -> np.ndarray:
+        """
+        Indices of the children to evaluate, in their original order.
+        Children flagged in `known`, fitness cache hits say, cost nothing to
+        evaluate: they are always kept and neither predicted nor counted.
+        """
+        self._predicted = None
+        known = np.zeros(len(genes), dtype=bool) if known is None else np.asarray(known, dtype=bool)
+        unknown = np.flatnonzero(~known)
+        if len(self.model) < self.warmup or not len(unknown):
+            return np.arange(len(genes))
+
+        predicted = self.model.predict(self._scale(np.asarray(genes)[unknown]))
+        order = np.argsort(-predicted, kind="stable")
+        promising = math.ceil(self.fraction * len(unknown))
+        rejected = order[promising:]
+        chosen = np.sort(np.concatenate([order[:promising], rejected[rng.random(len(rejected)) < self.audit]]))
+        keep = np.sort(np.concatenate([np.flatnonzero(known), unknown[chosen]]))
+
+        self.candidates += len(unknown)
+        self.saved += len(unknown) - len(chosen)
+        self._predicted = predicted[chosen]
+        self._predicted_kept = ~known[keep]
+        return keep
+
+    def validate(self, fitness) -> None:
+        """True fitness of the children screen() kept, in the same order."""
+        if self._predicted is None:
+            return
+        fitness = np.asarray(fitness, dtype=float)[self._predicted_kept]
+        pairs = np.column_stack([self._predicted, fitness])
+        self._pairs = np.concatenate([self._pairs, pairs])[-self.window:]
+        self.rank_correlation = rank_correlation(self._pairs[:, 0], self._pairs[:, 1])
+        self._predicted = None
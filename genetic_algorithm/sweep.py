@@ -0,0 +1,181 @@
+"""
+Runs every combination of scenario, parameters and seed in a grid file on
+a bounded process pool and writes one row per run to a CSV table.
+
+    python -m genetic_algorithm.sweep examples/wifi_coverage/sweep.toml [--workers 8] [--output sweep.csv]
+
+The grid is TOML or JSON:
+
+    algorithm = "examples.wifi_coverage.run:WiFiCoverageGeneticAlgorithm"
+    seeds = [0, 1, 2]
+
+    [scenarios.office]
+    preset = "3"
+
+    [parameters]
+    mutation_rate = [0.1, 0.25]
+    population_size = [100, 200]
+
+Each run is a subclass of `algorithm` with the class attributes of its
+scenario and parameter combination; selection_method and
+replacement_method may be given by name. A scenario is prepared once, in
+this process, by algorithm.prepare_scenario(**scenario) when the class has
+one (building a floor plan, say), and sent to each worker once rather
+than with every run.
+"""
+import argparse
+import csv
+import importlib
+import itertools
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from genetic_algorithm import GeneticAlgorithm, ReplacementMethod, SelectionMethods
+from genetic_algorithm.reporting import configure_logging
+from genetic_algorithm.vectorized import VectorizedGeneticAlgorithm, VectorizedSelectionMethods
+
+logger = logging.getLogger(__name__)
+
+RESULT_FIELDS = ["best_fitness", "generations_run", "stop_reason", "evaluations", "seconds", "best_chromosome", "error"]
+
+# set in each worker by _initialise_worker
+_algorithm_class = None
+_scenarios = {}
+
+
+def load_grid(path: str) -> dict:
+    with open(path, "rb") as file:
+        if not path.endswith(".toml"):
+            return json.load(file)
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+        return tomllib.load(file)
+
+
+def load_algorithm(name: str) -> type:
+    module, _, attribute = name.partition(":")
+    algorithm_class = getattr(importlib.import_module(module), attribute)
+    if not (isinstance(algorithm_class, type) and issubclass(algorithm_class, GeneticAlgorithm)):
+        raise ValueError(f"{name} is not a GeneticAlgorithm subclass")
+    return algorithm_class
+
+
+def prepare_scenarios(algorithm_class: type, scenarios: dict) -> dict:
+    if not scenarios:
+        return {"": {}}
+    prepare = getattr(algorithm_class, "prepare_scenario", None)
+    return {name: prepare(**scenario) if prepare else dict(scenario) for name, scenario in scenarios.items()}
+
+
+def parameter_grid(parameters: dict) -> list:
+    names = list(parameters)
+    values = [value if isinstance(value, list) else [value] for value in parameters.values()]
+    return [dict(zip(names, combination)) for combination in itertools.product(*values)]
+
+
+def class_attribute(algorithm_class: type, name: str, value):
+    if name == "replacement_method" and isinstance(value, str):
+        return ReplacementMethod[value]
+    if name == "selection_method" and isinstance(value, str):
+        vectorized = issubclass(algorithm_class, VectorizedGeneticAlgorithm)
+        return getattr(VectorizedSelectionMethods if vectorized else SelectionMethods, value)
+    return value
+
+
+def _initialise_worker(algorithm_class: type, scenarios: dict) -> None:
+    global _algorithm_class, _scenarios
+    _algorithm_class, _scenarios = algorithm_class, scenarios
+    # the parent reports progress; a run's own summary would drown it out
+    logging.getLogger("genetic_algorithm").setLevel(logging.WARNING)
+
+
+def _run(scenario: str, parameters: dict, seed: int) -> dict:
+    attributes = dict(_scenarios[scenario])
+    attributes.update({name: class_attribute(_algorithm_class, name, value) for name, value in parameters.items()})
+    ga = type(_algorithm_class.__name__, (_algorithm_class,), attributes)()
+    ga.reseed(seed)
+    start = time.perf_counter()
+    ga.run()
+    best = ga.best_individual()
+    return {
+        "best_fitness": ga.best_fitness(),
+        "generations_run": ga.generation,
+        "stop_reason": ga.stop_reason,
+        "evaluations": ga.evaluations,
+        "seconds": round(time.perf_counter() - start, 3),
+        "best_chromosome": json.dumps(ga.decode(best.genes)),
+    }
+
+
+def sweep(grid: dict, workers: int = None, output: str = None) -> list:
+    """Runs the grid and returns its rows, also written to `output` as they complete."""
+    algorithm_class = load_algorithm(grid["algorithm"])
+    scenarios = prepare_scenarios(algorithm_class, grid.get("scenarios", {}))
+    combinations = parameter_grid(grid.get("parameters", {}))
+    seeds = grid.get("seeds", [0])
+    workers = workers or grid.get("workers") or os.cpu_count()
+    output = output or grid.get("output", "sweep.csv")
+
+    runs = list(itertools.product(scenarios, combinations, seeds))
+    fields = ["run", "scenario", "seed", *combinations[0], *RESULT_FIELDS]
+    logger.info("%d runs of %s on %d workers", len(runs), algorithm_class.__name__, workers)
+
+    rows = []
+    with open(output, "w", newline="") as file, ProcessPoolExecutor(
+            max_workers=workers, initializer=_initialise_worker, initargs=(algorithm_class, scenarios)
+    ) as executor:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        futures = {executor.submit(_run, *run): (i, *run) for i, run in enumerate(runs)}
+        for future in as_completed(futures):
+            i, scenario, parameters, seed = futures[future]
+            row = {"run": i, "scenario": scenario, "seed": seed, **parameters}
+            try:
+                row.update(future.result())
+            except Exception as error:
+                # one failed run should not cost the rest of the night's sweep
+                logger.exception("Run %d failed", row["run"])
+                row["error"] = repr(error)
+            else:
+                logger.info("Run %d/%d: %s seed %d, best fitness %s after %d generations",
+                            len(rows) + 1, len(runs), row["scenario"] or "-", row["seed"], row["best_fitness"],
+                            row["generations_run"])
+            rows.append(row)
+            writer.writerow(row)
+            file.flush()
+
+    rows.sort(key=lambda row: row["run"])
+    _log_best(rows)
+    logger.info("Results written to %s", output)
+    return rows
+
+
+def _log_best(rows: list) -> None:
+    best = {}
+    for row in rows:
+        if row.get("error") is not None:
+            continue
+        if row["scenario"] not in best or row["best_fitness"] > best[row["scenario"]]["best_fitness"]:
+            best[row["scenario"]] = row
+    for scenario, row in best.items():
+        logger.info("Best of %s: run %d, fitness %s", scenario or "-", row["run"], row["best_fitness"])
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("grid", help="TOML or JSON grid file")
+    parser.add_argument("--workers", type=int, help="runs at once, default the grid's workers or the CPU count")
+    parser.add_argument("--output", help="CSV results table, default the grid's output or sweep.csv")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    sweep(load_grid(args.grid), args.workers, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Per-generation telemetry streamed to disk while the run is going.
+
+    ga.reporters = [JSONLinesSink("run.jsonl")]
+    ga.run()
+
+    python -m genetic_algorithm.telemetry run.jsonl --output fitness-graph.png
+"""
+import argparse
+import csv
+import json
+import os
+
+from genetic_algorithm.reporting import Reporter
+
+BUFFER_SIZE = 1 << 16
+
+
+class JSONLinesSink(Reporter):
+    """
+    One JSON object per generation. Writes are buffered; pass append=True
+    when resuming a checkpointed run into the same file.
+    """
+
+    def __init__(self, path: str, append: bool = False, buffering: int = BUFFER_SIZE):
+        self.path = path
+        self.append = append
+        self.buffering = buffering
+        self.file = None
+
+    def start(self, ga) -> None:
+        self.file = open(self.path, "a" if self.append else "w", buffering=self.buffering)
+
+    def generation(self, ga, record: dict) -> None:
+        self.file.write(json.dumps(record))
+        self.file.write("\n")
+
+    def end(self, ga, fitness_graph: list) -> None:
+        self.file.close()
+        self.file = None
+
+
+class CSVSink(Reporter):
+    """
+    One row per generation, the columns are taken from the first record, or
+    from the existing header when appending to a non-empty file.
+    """
+
+    def __init__(self, path: str, append: bool = False, buffering: int = BUFFER_SIZE):
+        self.path = path
+        self.append = append
+        self.buffering = buffering
+        self.file = None
+        self.writer = None
+
+    def start(self, ga) -> None:
+        self.file = open(self.path, "a+" if self.append else "w", buffering=self.buffering, newline="")
+        self.writer = None
+        if self.file.tell():
+            # a resumed run lacks columns of the first records (initialisation_seconds), keep
+            # the header so the appended rows stay aligned
+            self.file.seek(0)
+            header = next(csv.reader(self.file), None)
+            self.file.seek(0, os.SEEK_END)
+            if header:
+                self.writer = csv.DictWriter(self.file, fieldnames=header, restval="", extrasaction="ignore")
+
+    def generation(self, ga, record: dict) -> None:
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.file, fieldnames=list(record), extrasaction="ignore")
+            if not self.file.tell():
+                self.writer.writeheader()
+        self.writer.writerow(record)
+
+    def end(self, ga, fitness_graph: list) -> None:
+        self.file.close()
+        self.file = None
+
+
+def read_telemetry(path: str) -> list:
+    with open(path, newline="") as f:
+        if path.endswith(".csv"):
+            return [
+                {name: float(value) if value else None for name, value in row.items()}
+                for row in csv.DictReader(f)
+            ]
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def plot_telemetry(path: str, output: str = "fitness-graph.png", columns: tuple = ("best",)) -> None:
+    import matplotlib.pyplot as plt
+
+    records = read_telemetry(path)
+    x_values = [record["generation"] for record in records]
+    for column in columns:
+        plt.plot(x_values, [record[column] for record in records], label=column)
+    plt.xlabel("Generation")
+    plt.ylabel("Fitness Value")
+    if len(columns) > 1:
+        plt.legend()
+
+    plt.title("Fitness Graph")
+
+    plt.savefig(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plot a telemetry stream (.jsonl or .csv)")
+    parser.add_argument("path")
+    parser.add_argument("--output", default="fitness-graph.png")
+    parser.add_argument("--columns", nargs="+", default=["best"])
+    args = parser.parse_args()
+    plot_telemetry(args.path, args.output, tuple(args.columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+import logging
+import time
+
+import numpy as np
+
+from genetic_algorithm import GeneticAlgorithm, ReplacementMethod, selection
+from genetic_algorithm.capacity import EvictionMethod, crowding_distance
+from genetic_algorithm.crossover import crossover
+from genetic_algorithm.individual import Individual
+from genetic_algorithm.mutation import mutate
+from genetic_algorithm.stats import gene_diversity
+
+logger = logging.getLogger(__name__)
+
+
+class VectorizedSelectionMethods:
+    @staticmethod
+    def tournament_selection(cls, fitness: np.ndarray, num_of_parents: int, **kwargs) -> np.ndarray:
+        # one independent tournament per parent, all run as a single argmax
+        size = cls.tournament_size or int(0.2 * len(fitness))
+        return selection.tournament(fitness, num_of_parents, size, cls.rng)[:, 0]
+
+    @staticmethod
+    def roulette_wheel_selection(cls, fitness: np.ndarray, num_of_parents: int, **kwargs) -> np.ndarray:
+        return selection.roulette_wheel(fitness, num_of_parents, cls.rng)
+
+    @staticmethod
+    def stochastic_universal_sampling(cls, fitness: np.ndarray, num_of_parents: int, **kwargs) -> np.ndarray:
+        return selection.stochastic_universal_sampling(fitness, num_of_parents, cls.rng)
+
+    @staticmethod
+    def rank_selection(cls, fitness: np.ndarray, num_of_parents: int, **kwargs) -> np.ndarray:
+        return selection.rank(fitness, num_of_parents, cls.rng)
+
+
+class VectorizedGeneticAlgorithm(GeneticAlgorithm):
+    """
+    Population stored as a 2-D array (individuals x genes) with a parallel
+    fitness vector. Integer genes are kept as whole numbers in a float array.
+    """
+    seed = None
+    tournament_size = 3
+    selection_method = VectorizedSelectionMethods.tournament_selection
+    _transient_state = GeneticAlgorithm._transient_state + ("genes", "fitness")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rng = np.random.default_rng(self.seed)
+        self.genes = np.empty((0, len(self.gene_space)))
+        self.fitness = np.empty(0)
+
+    def batch_fitness_func(self, matrix: np.ndarray) -> np.ndarray:
+        # override for objectives that can score the whole matrix at once
+        return np.array(self.evaluate_many([self.to_chromosome(row) for row in matrix]), dtype=float)
+
+    def to_chromosome(self, row: np.ndarray) -> list:
+        return [int(gene) if is_int else float(gene) for gene, is_int in zip(row, self.integer)]
+
+    def _initialise_population(self):
+        logger.info("Initialising population of %d individuals", self.population_size)
+        shape = (self.population_size, len(self.gene_space))
+        genes = self.rng.uniform(self.lower, self.upper, size=shape)
+        genes[:, self.integer] = self.rng.integers(
+            self.lower[self.integer], self.upper[self.integer], size=(shape[0], self.integer.sum()), endpoint=True
+        )
+        self.genes = genes
+        self.fitness = self._score(genes)
+
+    def perform_selection(self) -> np.ndarray:
+        return self.selection_method(self.fitness, self.num_of_parents)
+
+    def perform_crossover(self, parents: np.ndarray) -> np.ndarray:
+        pairs = len(parents) // 2
+        return crossover(
+            self.genes[parents[0:2 * pairs:2]],
+            self.genes[parents[1:2 * pairs:2]],
+            self._crossover_operator,
+            self.lower,
+            self.upper,
+            self.integer,
+            self.rng,
+        )
+
+    def perform_mutation(self, children: np.ndarray) -> np.ndarray:
+        return mutate(children, self.mutation_rate, self._mutation_plan, self.lower, self.upper, self.integer, self.rng)
+
+    def perform_replacement(self, parents: np.ndarray, children: np.ndarray, fitness: np.ndarray) -> None:
+        parents = parents[:len(children)]
+        if self.replacement_method == ReplacementMethod.NO_REPLACEMENT:
+            self.genes = np.concatenate([self.genes, children])
+            self.fitness = np.concatenate([self.fitness, fitness])
+
+        elif self.replacement_method == ReplacementMethod.RANDOM:
+            positions = self.rng.integers(0, len(self.genes), size=len(children))
+            self.genes[positions] = children
+            self.fitness[positions] = fitness
+
+        elif self.replacement_method == ReplacementMethod.BOTH_PARENTS:
+            self.genes[parents] = children
+            self.fitness[parents] = fitness
+
+        elif self.replacement_method == ReplacementMethod.WEAK_PARENTS:
+            stronger = fitness >= self.fitness[parents]
+            self.genes[parents[stronger]] = children[stronger]
+            self.fitness[parents[stronger]] = fitness[stronger]
+
+        elif self.replacement_method == ReplacementMethod.WEAK_INDIVIDUALS:
+            genes = np.concatenate([self.genes, children])
+            fitness = np.concatenate([self.fitness, fitness])
+            if len(fitness) > self.population_size:
+                keep = np.argpartition(fitness, -self.population_size)[-self.population_size:]
+                genes, fitness = genes[keep], fitness[keep]
+            self.genes, self.fitness = genes, fitness
+
+    def evolve(self) -> None:
+        parents = self._timed("selection", self.perform_selection)
+        children = self._timed("crossover", self.perform_crossover, parents)
+        children = self._timed("mutation", self.perform_mutation, children)
+        if self.surrogate:
+            parents, children = self._timed("screening", self._screen, parents, children)
+        fitness = self._timed("evaluation", self._score, children, parents[:len(children)])
+        if self.surrogate:
+            self.surrogate.validate(fitness)
+
+        self._timed("replacement", self.perform_replacement, parents, children, fitness)
+        self._timed("capacity", self._enforce_capacity)
+
+    def population_capacity(self) -> int:
+        capacity = self.max_population_size
+        if self.population_memory_budget is not None and len(self.fitness):
+            affordable = self.population_memory_budget // (self.genes.strides[0] + self.fitness.strides[0])
+            capacity = affordable if capacity is None else min(capacity, affordable)
+        return capacity
+
+    def _enforce_capacity(self) -> None:
+        capacity = self.population_capacity()
+        if capacity is None or len(self.fitness) <= capacity:
+            return
+        excess = len(self.fitness) - capacity
+
+        if self.eviction_method == EvictionMethod.AGE:
+            # only NO_REPLACEMENT grows the population and it appends, so the oldest rows come first
+            evicted = np.arange(excess)
+
+        elif self.eviction_method == EvictionMethod.WORST_FITNESS:
+            evicted = np.argpartition(self.fitness, excess - 1)[:excess]
+
+        elif self.eviction_method == EvictionMethod.CROWDING_DISTANCE:
+            evicted = np.argsort(crowding_distance(self.genes), kind="stable")[:excess]
+
+        self.genes = np.delete(self.genes, evicted, axis=0)
+        self.fitness = np.delete(self.fitness, evicted)
+
+    def _screen(self, parents: np.ndarray, children: np.ndarray) -> tuple:
+        known = None
+        if type(self).batch_fitness_func is VectorizedGeneticAlgorithm.batch_fitness_func:
+            # rows scored one by one go through the fitness cache first
+            known = [tuple(self.to_chromosome(row)) in self.fitness_cache for row in children]
+        keep = self.surrogate.screen(children, self.rng, known)
+        return parents[:len(children)][keep], children[keep]
+
+    def _score(self, matrix: np.ndarray, parents: np.ndarray = None) -> np.ndarray:
+        # parents[i], when given, is the row of self.genes that row i was bred from;
+        # the row-wise default counts its own fitness_func calls
+        if type(self).batch_fitness_func is VectorizedGeneticAlgorithm.batch_fitness_func:
+            if parents is not None and self.incremental:
+                chromosomes = [self.to_chromosome(row) for row in matrix]
+                bred_from = [self.to_chromosome(row) for row in self.genes[parents]]
+                return np.array(self.evaluate_many(chromosomes, bred_from), dtype=float)
+            return self.batch_fitness_func(matrix)
+        start = time.perf_counter()
+        fitness = self.batch_fitness_func(matrix)
+        self._record_fitness_calls(len(matrix), time.perf_counter() - start)
+        if self.surrogate:
+            self.surrogate.observe(matrix, fitness)
+        return fitness
+
+    @property
+    def population_count(self) -> int:
+        return len(self.fitness)
+
+    def fitness_summary(self) -> tuple:
+        return (
+            float(self.fitness.max()),
+            float(self.fitness.min()),
+            float(self.fitness.mean()),
+            float(self.fitness.std()),
+        )
+
+    def diversity(self) -> float:
+        return gene_diversity(self.genes, self.lower, self.upper)
+
+    def best_individual(self) -> Individual:
+        best = int(np.argmax(self.fitness))
+        return Individual(self.to_chromosome(self.genes[best]), float(self.fitness[best]), id=best)
+
+    def emigrants(self, k: int) -> np.ndarray:
+        k = min(k, len(self.fitness))
+        return self.genes[np.argpartition(self.fitness, -k)[-k:]].copy()
+
+    def immigrate(self, chromosomes) -> None:
+        chromosomes = np.asarray(chromosomes, dtype=float)[:len(self.fitness)]
+        if not len(chromosomes):
+            return
+        weakest = np.argpartition(self.fitness, len(chromosomes) - 1)[:len(chromosomes)]
+        self.genes[weakest] = chromosomes
+        self.fitness[weakest] = self._score(chromosomes)
+
+    def best_fitness(self) -> float:
+        return float(self.fitness.max())
+
+    def reseed(self, seed=None) -> None:
+        super().reseed(seed)
+        self.rng = np.random.default_rng(seed)
+
+    def checkpoint_state(self) -> dict:
+        state = super().checkpoint_state()
+        state["meta"]["numpy_random_state"] = self.rng.bit_generator.state
+        return state
+
+    def restore(self, state: dict) -> None:
+        super().restore(state)
+        self.rng.bit_generator.state = state["meta"]["numpy_random_state"]
+
+    def _population_state(self) -> dict:
+        # copies, the writer thread must not see later in-place replacements
+        return {"genes": self.genes.copy(), "fitness": self.fitness.copy()}
+
+    def _restore_population(self, state: dict) -> None:
+        self.genes = state["genes"]
+        self.fitness = state["fitness"]
+
+    def sort_population(self) -> None:
+        order = np.argsort(self.fitness)[::-1]
+        self.genes = self.genes[order]
+        self.fitness = self.fitness[order]
+
+    def _log_summary(self):
+        logger.info("Individuals %d", len(self.genes))
+
+        self.sort_population()
+
+        for genes, fitness in zip(self.genes[:3], self.fitness[:3]):
+            logger.info("Best individual %s %s", self.to_chromosome(genes), fitness)
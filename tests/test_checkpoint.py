@@ -0,0 +1,63 @@
+import pytest
+
+from examples.six_hump_camel_function import SixHumpCamelVectorizedGeneticAlgorithm
+from examples.wifi_coverage.run import WiFiCoverageGeneticAlgorithm
+from genetic_algorithm.checkpoint import Checkpoint
+from genetic_algorithm.surrogate import SurrogateScreen
+
+
+class SmallSixHumpCamel(SixHumpCamelVectorizedGeneticAlgorithm):
+    generations = 20
+    population_size = 2000
+    num_of_parents = 400
+    seed = 3
+
+
+class ScreenedWiFiCoverage(WiFiCoverageGeneticAlgorithm):
+    surrogate = SurrogateScreen("knn", warmup=50)
+
+
+def run(algorithm_class, seed, generations=None, reporters=()):
+    ga = algorithm_class()
+    ga.reseed(seed)
+    if generations is not None:
+        ga.generations = generations
+    ga.reporters = list(reporters)
+    ga.run()
+    return ga
+
+
+def resumed(algorithm_class, path):
+    ga = algorithm_class()
+    ga.resume(path)
+    ga.run()
+    return ga
+
+
+@pytest.mark.parametrize("algorithm_class", [WiFiCoverageGeneticAlgorithm, ScreenedWiFiCoverage])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_resume_matches_uninterrupted_run(tmp_path, algorithm_class, seed):
+    path = str(tmp_path / "checkpoint.npz")
+    straight = run(algorithm_class, seed)
+    run(algorithm_class, seed, generations=40, reporters=[Checkpoint(path, every=1000)])
+    ga = resumed(algorithm_class, path)
+
+    assert ga.fitness_graph == straight.fitness_graph
+    assert ga.stop_reason == straight.stop_reason
+    assert ga.evaluations == straight.evaluations
+    assert [(list(individual.genes), individual.fitness) for individual in ga.population] == [
+        (list(individual.genes), individual.fitness) for individual in straight.population
+    ]
+    if ga.surrogate:
+        assert (ga.surrogate.saved, ga.surrogate.candidates) == (straight.surrogate.saved, straight.surrogate.candidates)
+
+
+def test_vectorized_resume_matches_uninterrupted_run(tmp_path):
+    path = str(tmp_path / "checkpoint.npz")
+    straight = run(SmallSixHumpCamel, 0)
+    run(SmallSixHumpCamel, 0, generations=10, reporters=[Checkpoint(path, every=1000)])
+    ga = resumed(SmallSixHumpCamel, path)
+
+    assert ga.fitness_graph == straight.fitness_graph
+    assert (ga.genes == straight.genes).all()
+    assert (ga.fitness == straight.fitness).all()
@@ -0,0 +1,70 @@
+import math
+import random
+
+import pytest
+
+from examples.coverage.coverage_index import CoverageIndex, popcount
+from examples.coverage.plan import Plan
+
+
+def distance_loop(chromosome, targets, max_sensors):
+    # the scoring the plan had before the coverage index
+    no_of_sensors = chromosome[0]
+    sensors = [chromosome[i: i + 3] for i in range(1, len(chromosome), 3)][:no_of_sensors]
+    connected = set()
+    signal_qualities = []
+    for target in targets:
+        for sensor_range, x, y in sensors:
+            signal_quality = math.dist((x, y), target)
+            if signal_quality <= sensor_range and target not in connected:
+                connected.add(target)
+                signal_qualities.append(signal_quality)
+
+    coverage = len(connected) / len(targets)
+    signal_qualities = sum(signal_qualities) and 1 / sum(signal_qualities) or 0
+    efficiency = max_sensors / no_of_sensors
+    return 3 * coverage + 0.5 * signal_qualities + efficiency
+
+
+def random_chromosome(rng, max_sensors, max_range, dimensions):
+    w, h = dimensions
+    chromosome = [rng.randint(1, max_sensors)]
+    for _ in range(max_sensors):
+        chromosome += [rng.randint(1, max_range), rng.randint(0, w), rng.randint(0, h)]
+    return chromosome
+
+
+@pytest.mark.parametrize(
+    "targets, max_sensors, max_range, dimensions",
+    [
+        ([(25, 25), (75, 75)], 2, 30, (100, 100)),
+        # enough sensors and range for the coverage circles to overlap
+        ([(x + 0.5, y * 1.5) for x in range(0, 20, 3) for y in range(0, 13, 2)], 6, 8, (20, 20)),
+        # more targets than fit in one byte of the bitset
+        ([(x * 0.7, y * 1.3) for x in range(30) for y in range(15)], 4, 10, (21, 20)),
+    ],
+)
+def test_coverage_index_scores_like_the_distance_loop(targets, max_sensors, max_range, dimensions):
+    rng = random.Random(0)
+    coverage_index = CoverageIndex(targets)
+    for _ in range(300):
+        chromosome = random_chromosome(rng, max_sensors, max_range, dimensions)
+        plan = Plan(chromosome, targets, dimensions, max_sensors, coverage_index)
+
+        assert plan.evaluate() == pytest.approx(distance_loop(chromosome, targets, max_sensors))
+
+
+def test_lookup_bitset_marks_the_covered_targets():
+    targets = [(0, 0), (3, 4), (6, 8), (1, 1), (10, 0)]
+    mask, distances = CoverageIndex(targets).lookup(5, 0, 0)
+
+    assert [bool(mask >> i & 1) for i in range(len(targets))] == [True, True, False, True, False]
+    assert popcount(mask) == 3
+    assert distances == pytest.approx(5 + math.sqrt(2))
+
+
+def test_precompute_fills_every_sensor_position():
+    coverage_index = CoverageIndex([(1, 1), (2, 3)])
+    coverage_index.precompute(3, (4, 5))
+
+    assert len(coverage_index) == 3 * 5 * 6
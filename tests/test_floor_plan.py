@@ -0,0 +1,67 @@
+import random
+
+import numpy as np
+import pytest
+
+from examples.wifi_coverage.floor_plan import FloorPlan
+from examples.wifi_coverage.plan import WALL_TYPE
+from examples.wifi_coverage.run import WALLS
+from examples.wifi_coverage.utils import segment_intersect
+
+WALL_TYPES = [WALL_TYPE.CONCRETE, WALL_TYPE.DRY_WALL, WALL_TYPE.LIME_BRICK, WALL_TYPE.CHIP_BOARD]
+
+
+def intersect_loop(walls, routers, users):
+    # the wall loss of every path as the plan found it before the floor plan
+    losses = np.zeros((len(routers), len(users)))
+    for i, router in enumerate(routers):
+        for j, user in enumerate(users):
+            for point_1, point_2, wall_type in walls:
+                if segment_intersect((router, user), (point_1, point_2)):
+                    losses[i, j] += wall_type
+    return losses
+
+
+def random_point(rng, size):
+    # on a coarse grid, so paths run through wall ends and along walls
+    return rng.randint(0, size), rng.randint(0, size)
+
+
+def random_walls(rng, count, size):
+    return [(random_point(rng, size), random_point(rng, size), rng.choice(WALL_TYPES)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_wall_attenuation_matches_segment_intersect(seed):
+    rng = random.Random(seed)
+    walls = random_walls(rng, 15, 10)
+    routers = [random_point(rng, 10) for _ in range(6)]
+    users = [random_point(rng, 10) for _ in range(25)]
+
+    np.testing.assert_allclose(FloorPlan(walls).wall_attenuation(routers, users), intersect_loop(walls, routers, users))
+
+
+def test_wall_attenuation_of_the_scenario_walls():
+    rng = random.Random(0)
+    xs = [x for (x, _), _, _ in WALLS] + [x for _, (x, _), _ in WALLS]
+    ys = [y for (_, y), _, _ in WALLS] + [y for _, (_, y), _ in WALLS]
+    routers = [(rng.uniform(min(xs), max(xs)), rng.uniform(min(ys), max(ys))) for _ in range(5)]
+    users = [(rng.uniform(min(xs), max(xs)), rng.uniform(min(ys), max(ys))) for _ in range(40)]
+
+    np.testing.assert_allclose(FloorPlan(WALLS).wall_attenuation(routers, users), intersect_loop(WALLS, routers, users))
+
+
+def test_wall_attenuation_without_walls_routers_or_users():
+    walls = [((0, 0), (0, 5), WALL_TYPE.CONCRETE)]
+
+    assert FloorPlan().wall_attenuation([(1, 1)], [(2, 2), (3, 3)]).tolist() == [[0.0, 0.0]]
+    assert FloorPlan(walls).wall_attenuation([], [(2, 2)]).shape == (0, 1)
+    assert FloorPlan(walls).wall_attenuation([(1, 1)], []).shape == (1, 0)
+
+
+def test_router_on_its_user_crosses_no_wall():
+    walls = [((0, 0), (0, 5), WALL_TYPE.CONCRETE), ((0, 2), (4, 2), WALL_TYPE.DRY_WALL)]
+
+    losses = FloorPlan(walls).wall_attenuation([(0, 2)], [(0, 2), (2, 3)])
+
+    assert losses.tolist() == [[0.0, WALL_TYPE.CONCRETE + WALL_TYPE.DRY_WALL]]
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from examples.wifi_coverage.run import WiFiCoverageGeneticAlgorithm, WiFiCoverageMultiObjectiveGeneticAlgorithm
+
+
+def run(algorithm_class, seed, **attributes):
+    ga = type(algorithm_class.__name__, (algorithm_class,), attributes)()
+    ga.reseed(seed)
+    ga.run()
+    return ga
+
+
+@pytest.mark.parametrize("preset", ["1.3", "2.1", "3"])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_incremental_evaluation_matches_from_scratch(preset, seed):
+    scenario = WiFiCoverageGeneticAlgorithm.prepare_scenario(preset=preset)
+    scenario.pop("partials_cache_size")
+    incremental = run(WiFiCoverageGeneticAlgorithm, seed, partials_cache_size=None, **scenario)
+    from_scratch = run(WiFiCoverageGeneticAlgorithm, seed, partials_cache_size=0, **scenario)
+
+    assert incremental.incremental and not from_scratch.incremental
+    assert incremental.delta_evaluations > 0
+    assert incremental.fitness_graph == from_scratch.fitness_graph
+    assert [individual.genes for individual in incremental.population] == [
+        individual.genes for individual in from_scratch.population
+    ]
+
+
+def test_multiobjective_incremental_evaluation_matches_from_scratch():
+    incremental = run(WiFiCoverageMultiObjectiveGeneticAlgorithm, 0, generations=20, partials_cache_size=None)
+    from_scratch = run(WiFiCoverageMultiObjectiveGeneticAlgorithm, 0, generations=20, partials_cache_size=0)
+
+    assert incremental.delta_evaluations > 0
+    assert np.array_equal(incremental.fitness, from_scratch.fitness)
+    assert np.array_equal(incremental.genes, from_scratch.genes)
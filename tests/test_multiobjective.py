@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from genetic_algorithm import EvictionMethod
+from genetic_algorithm.multiobjective import MultiObjectiveGeneticAlgorithm, crowded_order, non_dominated_sort
+
+# both objectives maximised
+OBJECTIVES = np.array([
+    [4.0, 1.0],  # 0: front 0
+    [3.0, 3.0],  # 1: front 0
+    [1.0, 4.0],  # 2: front 0
+    [3.0, 1.0],  # 3: dominated by 0 and 1
+    [2.0, 2.0],  # 4: dominated by 1 only
+    [1.0, 1.0],  # 5: dominated by 3 and 4
+    [3.0, 3.0],  # 6: a copy of 1 is not dominated by it
+    [0.0, 0.0],  # 7: dominated by 5
+    [0.0, 4.0],  # 8: dominated by 2
+])
+
+
+def dominates(a, b):
+    return (a >= b).all() and (a > b).any()
+
+
+def test_non_dominated_sort_on_a_hand_built_set():
+    assert non_dominated_sort(OBJECTIVES).tolist() == [0, 0, 0, 1, 1, 2, 0, 3, 1]
+
+
+def test_non_dominated_sort_matches_pairwise_dominance():
+    objectives = np.random.default_rng(0).integers(0, 5, size=(200, 3)).astype(float)
+    rank = non_dominated_sort(objectives)
+    for i, row in enumerate(objectives):
+        dominators = [j for j, other in enumerate(objectives) if dominates(other, row)]
+        # a row sits one front behind the worst of the rows dominating it
+        assert rank[i] == (max(rank[dominators]) + 1 if dominators else 0)
+
+
+def test_crowded_order_puts_the_boundaries_of_a_front_first():
+    objectives = np.array([[0.0, 4.0], [1.0, 3.0], [1.5, 2.5], [3.0, 1.0], [4.0, 0.0], [0.0, 0.0]])
+    rank, crowding, order = crowded_order(objectives)
+
+    assert rank.tolist() == [0, 0, 0, 0, 0, 1]
+    assert np.isinf(crowding[[0, 4]]).all()
+    assert set(order[:2]) == {0, 4}
+    # (1, 3) has the closest neighbours of the front, (3, 1) the farthest
+    assert order.tolist()[2:] == [3, 2, 1, 5]
+
+
+class Schaffer(MultiObjectiveGeneticAlgorithm):
+    gene_space = [(float, -10, 10)]
+    generations = 10
+    mutation_rate = 0.2
+    num_of_parents = 40
+    population_size = 100
+
+    def fitness_func(self, chromosome: list) -> tuple:
+        return -chromosome[0] ** 2, -(chromosome[0] - 2) ** 2
+
+    def batch_fitness_func(self, matrix: np.ndarray) -> np.ndarray:
+        x = matrix[:, 0]
+        return np.column_stack((-x ** 2, -(x - 2) ** 2))
+
+
+@pytest.mark.parametrize("eviction_method", list(EvictionMethod))
+def test_capacity_keeps_the_best_crowded_rows(eviction_method):
+    ga = Schaffer()
+    ga.reseed(0)
+    ga.max_population_size = 60
+    ga.eviction_method = eviction_method
+    ga.run()
+
+    assert ga.genes.shape == (60, 1)
+    assert ga.fitness.shape == (60, 2)
+    rank, _, _ = crowded_order(ga.fitness)
+    assert (ga.rank == rank).all()
+    # the Pareto set of Schaffer's problem is 0 <= x <= 2
+    assert ((ga.genes[ga.rank == 0] >= -0.5) & (ga.genes[ga.rank == 0] <= 2.5)).all()
+
+
+def test_memory_budget_counts_every_objective():
+    ga = Schaffer()
+    ga.reseed(0)
+    # genes plus two objectives: 24 bytes a row
+    ga.population_memory_budget = 50 * 24
+    ga.run()
+
+    assert len(ga.fitness) == 50
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from genetic_algorithm.mutation import (
+    CreepMutation,
+    GaussianMutation,
+    PolynomialMutation,
+    UniformMutation,
+    mutate,
+    mutation_plan,
+)
+
+GENE_SPACE = [(int, 0, 9), (float, -1.0, 1.0), (int, -5, 5), (float, 0.0, 0.001), (int, 3, 3), (float, 2.5, 2.5)]
+LOWER = np.array([gene_lower for _, gene_lower, _ in GENE_SPACE], dtype=float)
+UPPER = np.array([gene_upper for _, _, gene_upper in GENE_SPACE], dtype=float)
+INTEGER = np.array([gene_type == int for gene_type, _, _ in GENE_SPACE])
+
+
+def population(rng, size=500):
+    genes = rng.uniform(LOWER, UPPER, size=(size, len(GENE_SPACE)))
+    genes[:, INTEGER] = np.rint(genes[:, INTEGER])
+    # the bounds themselves are where reflection and clipping go wrong
+    genes[:10] = LOWER
+    genes[10:20] = UPPER
+    return genes
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        None,
+        "uniform",
+        "gaussian",
+        "creep",
+        "polynomial",
+        UniformMutation(width=50.0),
+        GaussianMutation(sigma=20.0),
+        CreepMutation(step=7),
+        UniformMutation(width=50.0, boundary="clamp"),
+        ["creep", "gaussian", CreepMutation(step=12), "polynomial", "uniform", GaussianMutation(sigma=3.0)],
+    ],
+)
+def test_mutated_genes_stay_in_bounds(spec):
+    rng = np.random.default_rng(0)
+    plan = mutation_plan(spec, GENE_SPACE)
+    genes = population(rng)
+    for _ in range(20):
+        genes = mutate(genes, 1.0, plan, LOWER, UPPER, INTEGER, rng)
+
+        assert (genes >= LOWER).all() and (genes <= UPPER).all()
+        assert (genes[:, INTEGER] == np.rint(genes[:, INTEGER])).all()
+
+
+def test_rate_zero_leaves_genes_alone():
+    rng = np.random.default_rng(1)
+    genes = population(rng)
+
+    assert (mutate(genes, 0.0, mutation_plan(None, GENE_SPACE), LOWER, UPPER, INTEGER, rng) == genes).all()
+
@@ -0,0 +1,94 @@
+from array import array
+
+import pytest
+
+from genetic_algorithm import GeneticAlgorithm, ReplacementMethod, SelectionMethods
+from genetic_algorithm.individual import Individual
+
+
+class DigitSum(GeneticAlgorithm):
+    gene_space = [(int, 0, 9)] * 3
+    generations = 30
+    mutation_rate = 0.2
+    num_of_parents = 6
+    population_size = 10
+    selection_method = SelectionMethods.tournament_selection
+    replacement_method = ReplacementMethod.BOTH_PARENTS
+
+    def fitness_func(self, chromosome: list) -> float:
+        return float(sum(chromosome))
+
+
+def algorithm(replacement_method):
+    ga = type("DigitSum", (DigitSum,), {"replacement_method": replacement_method})()
+    ga.reseed(0)
+    return ga
+
+
+def population(replacement_method):
+    ga = algorithm(replacement_method)
+    ga._initialise_population()
+    return ga
+
+
+def child(fitness):
+    return Individual(array("q", [0, 0, 0]), fitness)
+
+
+def rescore(ga, individual, fitness):
+    # through the stats, which rank the population by (fitness, id)
+    ga.stats.remove(individual.id, individual.fitness)
+    individual.fitness = fitness
+    ga.stats.add(individual.id, individual.fitness)
+
+
+def assert_slots_in_step(ga):
+    assert ga._slots == {individual.id: slot for slot, individual in enumerate(ga.population)}
+
+
+def assert_stats_in_step(ga):
+    assert sorted((individual.fitness, individual.id) for individual in ga.population) == ga.stats._ranked
+
+
+def test_both_parents_replaces_each_parent_in_place():
+    ga = population(ReplacementMethod.BOTH_PARENTS)
+    before = list(ga.population)
+    # parent 3 is picked twice and only has one slot to give
+    parents = [before[3], before[7], before[3], before[1]]
+    children = [child(1.0), child(2.0), child(3.0), child(4.0)]
+    ga.perform_replacement(parents, children)
+
+    assert len(ga.population) == len(before)
+    assert ga.population[3] is children[0]
+    assert ga.population[7] is children[1]
+    assert ga.population[1] is children[3]
+    assert children[2] not in ga.population
+    assert [ga.population[i] for i in (0, 2, 4, 5, 6, 8, 9)] == [before[i] for i in (0, 2, 4, 5, 6, 8, 9)]
+    assert_slots_in_step(ga)
+    assert_stats_in_step(ga)
+
+
+def test_weak_parents_compares_each_child_with_its_own_parent():
+    ga = population(ReplacementMethod.WEAK_PARENTS)
+    before = list(ga.population)
+    weak, strong = before[2], before[5]
+    rescore(ga, weak, 0.0)
+    rescore(ga, strong, 100.0)
+    children = [child(50.0), child(50.0)]
+    ga.perform_replacement([weak, strong], children)
+
+    assert ga.population[2] is children[0]
+    assert ga.population[5] is strong
+    assert_slots_in_step(ga)
+    assert_stats_in_step(ga)
+
+
+@pytest.mark.parametrize("replacement_method", list(ReplacementMethod))
+def test_population_stays_indexed_through_a_run(replacement_method):
+    ga = algorithm(replacement_method)
+    ga.run()
+
+    assert_slots_in_step(ga)
+    assert_stats_in_step(ga)
+    if replacement_method != ReplacementMethod.NO_REPLACEMENT:
+        assert len(ga.population) == ga.population_size